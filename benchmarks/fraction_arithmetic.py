@@ -0,0 +1,32 @@
+# benchmarks.fraction_arithmetic.py
+# written by Rushy Panchal
+# Version 1.0
+
+'''Times the Fraction operators on 355/113 and 22/7, in microseconds per operation
+
+Run from the root of the repository: python benchmarks/fraction_arithmetic.py
+'''
+
+from __future__ import print_function
+import decimal
+import timeit
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nums.Fraction import Fraction
+
+_cases = (('+', 'a + b'), ('-', 'a - b'), ('*', 'a * b'), ('/', 'a / b'), ('<', 'a < b'), ('==', 'a == b'),
+	('+ int', 'a + 3'), ('* Decimal', 'a * c'))
+
+def main(number = 200000, repeat = 5):
+	scope = {'a': Fraction(355, 113), 'b': Fraction(22, 7), 'c': decimal.Decimal('0.50')}
+	print('{0:<12} {1:>8}'.format('op', 'us'))
+	for name, statement in _cases:
+		best = min(timeit.repeat(statement, globals = scope, number = number, repeat = repeat)) if sys.version_info >= (3, 5) else \
+			min(timeit.Timer(statement, 'from __main__ import a, b, c').repeat(repeat, number))
+		print('{0:<12} {1:>8.2f}'.format(name, best / number * 1e6))
+
+if __name__ == '__main__':
+	main()
@@ -31,65 +31,176 @@ OVERVIEW:
 		# v1.12: Added '>', '>=', '<', '<=', '==', and '!=' logical operators; also, examples for each method were added
 	
 from __future__ import division
-from nums.number_theory import gcf, commonFactors
 from nums.errors import *
+from nums.errors import _numpy, _validation
+from array import array
+import itertools
+import decimal
+import sys
+
+try:
+	from math import gcd as _gcd # Python 3.5+
+except ImportError:
+	from fractions import gcd as _gcd
 
 __version__ = 1.11
 __author__ = "Rushy Panchal"
 
+### Exact conversion of numbers to integer ratios
+
+_numbers = types + (decimal.Decimal,)
+_modulus = sys.hash_info.modulus if hasattr(sys, 'hash_info') else None # Python 3 hashes every rational number modulo this prime
+
+_expressions = {'number': r'([+-]?)([0-9]*)(?:\.([0-9]*))?(?:[eE]([+-]?[0-9]+))?\Z', 'delimited': r'[^\s,]+'}
+_compiled = {}
+
+def _expression(name):
+	"""Returns the compiled regular expression _expressions[name], compiling it (and importing 're') on first use"""
+	if name not in _compiled:
+		import re
+		_compiled[name] = re.compile(_expressions[name])
+	return _compiled[name]
+
+_MAX_EXPONENT = 10000 # a few bytes such as '1e400000000' would otherwise make the parser build an enormous power of ten
+
+class _ExponentError(ValueError):
+	"""Raised by _parse_number for an exponent larger than _MAX_EXPONENT"""
+	pass
+
+def _parse_number(text):
+	"""Returns the exact (numerator, denominator) of an integer or decimal string such as '-12', '0.25' or '1e-3', or None
+	Raises an _ExponentError if the exponent is larger than _MAX_EXPONENT in absolute value"""
+	match = _expression('number').match(text)
+	if match is None: return None
+	sign, whole, fraction, exponent = match.groups()
+	fraction = fraction or ''
+	if not (whole or fraction): return None
+	if exponent and abs(int(exponent)) > _MAX_EXPONENT: raise _ExponentError(text)
+	n, d = int(whole + fraction), 10 ** len(fraction)
+	if exponent:
+		exponent = int(exponent)
+		if exponent >= 0: n *= 10 ** exponent
+		else: d *= 10 ** -exponent
+	return (-n if sign == '-' else n), d
+
+def _lowest(n, d):
+	"""Returns the pair n/d (with d > 0) in lowest terms"""
+	g = _gcd(n, d)
+	return (n // g, d // g) if g > 1 else (n, d)
+
+def _ratio(n):
+	"""Returns the exact (numerator, denominator) integers, in lowest terms, of an int, float, Decimal, Fraction, or numeric string
+	The arithmetic methods rely on both operands being in lowest terms"""
+	if isinstance(n, Fraction): return n._num, n._dom
+	if isinstance(n, float):
+		if n != n or n in (float('inf'), float('-inf')): raise NumericalError(value_("must be finite"))
+		return n.as_integer_ratio()
+	if isinstance(n, str):
+		try:
+			pair = _parse_number(n.strip())
+		except _ExponentError:
+			raise NumericalError(value_("the exponent of '{n}' is larger than {limit}".format(n = n, limit = _MAX_EXPONENT)))
+		if pair is None: raise NumericalError(value_("'{n}' is not a number".format(n = n)))
+		return _lowest(*pair)
+	if isinstance(n, decimal.Decimal):
+		sign, digits, exponent = n.as_tuple()
+		if not isinstance(exponent, int): raise NumericalError(value_("must be finite"))
+		value = int(''.join(map(str, digits)) or 0) * (-1 if sign else 1)
+		return (value * 10 ** exponent, 1) if exponent >= 0 else _lowest(value, 10 ** -exponent)
+	if not isinstance(n, types): raise NumericalError(type_(getError('num')))
+	return int(n), 1
+
+def _add(a, b, c, d):
+	"""Returns a/b + c/d for fractions in lowest terms (Henrici's algorithm)
+	Only the gcd of the denominators, and the gcd of the sum with it, are needed to keep the result in lowest terms"""
+	g = _gcd(b, d)
+	if g == 1: return Fraction._new(a * d + b * c, b * d)
+	s = b // g
+	t = a * (d // g) + c * s
+	g2 = _gcd(t, g)
+	if g2 == 1: return Fraction._new(t, s * d)
+	return Fraction._new(t // g2, s * (d // g2))
+	
+def _multiply(a, b, c, d):
+	"""Returns (a/b) * (c/d) for fractions in lowest terms with b, d > 0 (Henrici's algorithm)
+	Cancelling a with d and c with b first keeps the result in lowest terms"""
+	g1, g2 = _gcd(a, d), _gcd(c, b)
+	if g1 == 1 and g2 == 1: return Fraction._new(a * c, b * d)
+	return Fraction._new((a // g1) * (c // g2), (b // g2) * (d // g1))
+
+def _checked(result):
+	"""Returns the result of a Fraction operator, raising a NumericalError if the operand was not supported"""
+	if result is NotImplemented: raise NumericalError((getError('fraction')))
+	return result
+
 ### Main Fraction class
 
 class Fraction(object):
-	"""Class for explicit fractions"""
+	"""Class for explicit fractions
+	Fractions are immutable and always kept in lowest terms, with an integer numerator and a positive integer denominator"""
+	__slots__ = ('_num', '_dom')
+	
 	def __init__(self, numerator, denominator = None):
 		"""Creates a fraction with numerator / denominator
+		Floats and Decimals are converted exactly; strings can be "a/b" or a single number
 		>>> Fraction(1, 5)
 		<nums.Fraction.Fraction instance at 0x21796b0>: 1/5
-		>>> Fraction(0.2)
-		<nums.Fraction.Fraction instance at 0x213c4b0>: 0.2/1
-		>>> Fraction('1/5')
-		<nums.Fraction.Fraction instance at 0x21ecef0>: 1.0/5.0
+		>>> Fraction(0.25)
+		<nums.Fraction.Fraction instance at 0x213c4b0>: 1/4
+		>>> Fraction('2/10')
+		<nums.Fraction.Fraction instance at 0x21ecef0>: 1/5
 		>>> f = Fraction(1, 2)"""
 		if denominator is None:
-			if isinstance(numerator, str):
-				parts = numerator.split("/")
-				numerator, denominator = float(parts[0]), float(parts[1])
+			if isinstance(numerator, str) and "/" in numerator:
+				numerator, denominator = numerator.split("/", 1)
 			else:
 				denominator = 1
-		elif denominator == 0:
-			raise NumericalError(value_(getError('nonzero')))
-		for elem in (numerator, denominator):
-			if not isinstance(elem, types): raise NumericalError(type_(getError('num')))
-		self.num, self.dom = numerator, denominator
+		if _validation.enabled:
+			for elem in (numerator, denominator):
+				if not isinstance(elem, types + (str, decimal.Decimal, Fraction)): raise NumericalError(type_(getError('num')))
+		n1, d1 = _ratio(numerator)
+		n2, d2 = _ratio(denominator)
+		num, dom = n1 * d2, d1 * n2
+		if dom == 0: raise NumericalError(value_(getError('nonzero')))
+		if dom < 0: num, dom = -num, -dom
+		g = _gcd(num, dom)
+		if g != 1: num, dom = num // g, dom // g
+		self._num, self._dom = num, dom
+		
+	@classmethod
+	def _new(cls, numerator, denominator):
+		"""Creates a fraction from a numerator and positive denominator that are already in lowest terms"""
+		self = object.__new__(cls)
+		self._num, self._dom = numerator, denominator
+		return self
+		
+	num = property(lambda self: self._num, doc = "The numerator")
+	dom = property(lambda self: self._dom, doc = "The (positive) denominator")
 		
 	def fraction(self):
 		'''Returns a tuple of (numerator, denominator)
 		>>> f.fraction()
 		(1, 2)'''
-		return (self.num, self.dom)
+		return (self._num, self._dom)
 		
 	def decimal(self):
 		'''Returns the decimal value of a fraction
 		>>> f.decimal()
 		0.5'''
-		return self.num/self.dom
+		return self._num / self._dom
 		
 	def simplify(self):
-		'''Simplifies a fraction
+		'''Simplifies a fraction; fractions are always in lowest terms, so this is the fraction itself
 		>>> x = Fraction(5, 10)
 		>>> x.simplify()
-		<nums.Fraction.Fraction instance at 0x21ec7f0>: 1.0/2.0'''
-		self.gcf = int(gcf(self.num, self.dom))
-		if self.gcf == 0: self.gcf = 1
-		while self.num % self.gcf != 0 and self.num % self.gcf != 0: self.gcf -= 1
-		return Fraction(self.num/self.gcf, self.dom/self.gcf)
+		<nums.Fraction.Fraction instance at 0x21ec7f0>: 1/2'''
+		return self
 		
 	def change(self, numerator, denominator):
-		'''Changes the values of a fraction
+		'''Returns a new fraction with the given values (fractions are immutable)
 		>>> f.change(1, 5)
-		>>> f
 		<nums.Fraction.Fraction instance at 0x2249650>: 1/5'''
-		self.__init__(numerator, denominator)
+		return Fraction(numerator, denominator)
 		
 	def lcd(self, fraction):
 		'''Lowest common denominator of two fractions
@@ -101,169 +212,203 @@ class Fraction(object):
 			d1, d2 = self.dom, fraction[1]
 		else:
 			 raise NumericalError(type_("must be fraction or tuple"))
+		from nums.number_theory import commonFactors
 		return min(commonFactors(d1, d2))
 		
 	def reciprocal(self):
 		'''Reciprocal of the fraction
 		>>> f.reciprocal()
-		<nums.Fraction.Fraction instance at 0x21ec7f0>: 5/1'''
-		return Fraction(self.dom, self.num)
+		<nums.Fraction.Fraction instance at 0x21ec7f0>: 2/1'''
+		if self._num == 0: raise NumericalError(value_(getError('nonzero')))
+		if self._num < 0: return Fraction._new(-self._dom, -self._num)
+		return Fraction._new(self._dom, self._num)
 		
 	def makeFraction(self, n):
-		'''Makes an integer into a Fraction using this instance's denominator as the denominator of the new fraction
+		'''Makes a number into a Fraction
 		>>> f.makeFraction(25)
 		<nums.Fraction.Fraction instance at 0x21ec7f0>: 25/1'''
-		f = Fraction(n, 1)
-		f.makeDenom(self.dom)
-		return f.simplify()
+		return Fraction(n)
 		
 	def makeSame(self, fraction):
-		'''Changes 'fraction' to have the same denominator as the current instance
+		'''Returns 'fraction' as a (numerator, denominator) tuple with the same denominator as the current instance
 		>>> a = Fraction(1, 5)
 		>>> b = Fraction(23, 15)
 		>>> a.makeSame(b)
-		>>> a
-		<nums.Fraction.Fraction instance at 0x21ecf50>: 1/5
-		>>> b
-		<nums.Fraction.Fraction instance at 0x2249630>: 7.66666666667/5'''
-		fraction.makeDenom(self.dom)
+		(7.666666666666667, 5)'''
+		return fraction.makeDenom(self._dom)
 		
 	def makeDenom(self, denom):
-		'''Makes the denominator to 'denom' and scales the numerator appropiately
+		'''Returns the fraction as a (numerator, denominator) tuple with the denominator 'denom'
 		>>> f.makeDenom(25)
-		>>> f
-		<nums.Fraction.Fraction instance at 0x2249650>: 5.0/25'''
-		ratio = self.dom / denom
-		newNum = self.num / ratio
-		self.change(newNum, denom)
+		(12.5, 25)'''
+		numerator = self._num * denom
+		return (numerator // self._dom if numerator % self._dom == 0 else numerator / self._dom, denom)
 		
 	def makeNum(self, num):
-		'''Makes the numerator to 'num' and scales the denominator appropiately
+		'''Returns the fraction as a (numerator, denominator) tuple with the numerator 'num'
 		>>> f.makeNum(25)
-		>>> f
-		<nums.Fraction.Fraction instance at 0x2249650>: 25/125.0'''
-		ratio = self.num / num
-		newDenom = self.dom / ratio
-		self.change(num, newDenom)
+		(25, 50)'''
+		denominator = self._dom * num
+		return (num, denominator // self._num if denominator % self._num == 0 else denominator / self._num)
 		
 	def changeDenom(self, denom):
 		'''Same as makeDenom(self, denom)
-		>>> f.makeDenom(25)
-		>>> f
-		<nums.Fraction.Fraction instance at 0x2249650>: 5.0/25'''
-		self.makeDenom(denom)
+		>>> f.changeDenom(25)
+		(12.5, 25)'''
+		return self.makeDenom(denom)
 		
 	def changeNum(self, num):
 		'''Same as makeNum(self, num)
-		>>> f.makeNum(25)
-		>>> f
-		<nums.Fraction.Fraction instance at 0x2249650>: 25/125.0'''
-		self.makeNum(num)
+		>>> f.changeNum(25)
+		(25, 50)'''
+		return self.makeNum(num)
 		
 	def add(self, fraction):
-		'''Adds two fractions'''
-		if isinstance(fraction, types):
-			fraction = self.makeFraction(fraction)
-		if not isinstance(fraction, Fraction): raise NumericalError((getError('fraction')))
-		f1 = self.simplify()
-		f2 = fraction.simplify()
-		new_f2 = Fraction(*f2)
-		new_f2.makeDenom(f1[1])
-		f = Fraction(f1[0] + new_f2.num, f1[1])
-		return Fraction(*f.simplify())
+		'''Adds two fractions (or a fraction and a number)'''
+		return _checked(self.__add__(fraction))
 		
 	def subtract(self, fraction):
-		'''Subtracts fraction from this fraction'''
-		if isinstance(fraction, types):
-			fraction = self.makeFraction(fraction)
-		if not isinstance(fraction, Fraction): raise NumericalError((getError('fraction')))
-		f1 = self.simplify()
-		f2 = fraction.simplify()
-		new_f2 = Fraction(*f2)
-		new_f2.makeDenom(f1[1])
-		f = Fraction(f1[0] - new_f2.num, f1[1])
-		return Fraction(*f.simplify())
+		'''Subtracts fraction (or a number) from this fraction'''
+		return _checked(self.__sub__(fraction))
 		
 	def multiply(self, fraction):
-		'''Multiplies two fractions'''
-		if isinstance(fraction, types):
-			return (self.num*fraction, self.dom)
-		if not isinstance(fraction, Fraction): raise NumericalError((getError('fraction')))
-		return Fraction(self.num*fraction.num, self.dom*fraction.dom)
+		'''Multiplies two fractions (or a fraction and a number)'''
+		return _checked(self.__mul__(fraction))
 		
 	def divide(self, fraction):
-		'''Divides this fraction by fraction'''
-		r = fraction.reciprocal()
-		return self.multiply(Fraction(*r))
+		'''Divides this fraction by fraction (or a number)'''
+		return _checked(self.__truediv__(fraction))
 		
+	# Unlike the methods above, the operators return NotImplemented for unsupported operands,
+	# so Python can try the other operand (for example FractionArray.__radd__, or a NumPy scalar)
 	def __add__(self, other):
-		'''Allows the usage of the '+' operator with fractions'''
-		return self.add(other)
+		if isinstance(other, Fraction): return _add(self._num, self._dom, other._num, other._dom)
+		if not isinstance(other, _numbers): return NotImplemented
+		c, d = _ratio(other)
+		return _add(self._num, self._dom, c, d)
 		
+	__radd__ = __add__
+	
 	def __sub__(self, other):
-		'''Allows the usage of the '-' operator with fractions'''
-		return self.subtract(other)
+		if isinstance(other, Fraction): return _add(self._num, self._dom, -other._num, other._dom)
+		if not isinstance(other, _numbers): return NotImplemented
+		c, d = _ratio(other)
+		return _add(self._num, self._dom, -c, d)
 		
-	def __mul__(self, other):
-		'''Allows the usage of the '*' operator with fractions'''
-		return self.multiply(other)
+	def __rsub__(self, other):
+		'''Allows the usage of the '-' operator with a number on the left'''
+		if not isinstance(other, _numbers): return NotImplemented
+		c, d = _ratio(other)
+		return _add(c, d, -self._num, self._dom)
 		
-	def __div__(self, other):
-		'''Allows the usage of the '/' operator with fractions'''
-		return self.divide(other)
+	def __mul__(self, other):
+		if isinstance(other, Fraction): return _multiply(self._num, self._dom, other._num, other._dom)
+		if not isinstance(other, _numbers): return NotImplemented
+		c, d = _ratio(other)
+		return _multiply(self._num, self._dom, c, d)
 		
+	__rmul__ = __mul__
+	
 	def __truediv__(self, other):
-		'''Allows the usage of the '/' operator with fractions'''
-		return self.divide(other)
+		if isinstance(other, Fraction): c, d = other._num, other._dom
+		elif isinstance(other, _numbers): c, d = _ratio(other)
+		else: return NotImplemented
+		if c == 0: raise NumericalError(value_(getError('nonzero')))
+		return _multiply(self._num, self._dom, d, c) if c > 0 else _multiply(self._num, self._dom, -d, -c)
+		
+	def __rtruediv__(self, other):
+		'''Allows the usage of the '/' operator with a number on the left'''
+		if not isinstance(other, _numbers): return NotImplemented
+		return Fraction(other).divide(self)
+		
+	__div__ = __truediv__
+	__rdiv__ = __rtruediv__
+	
+	def __neg__(self):
+		return Fraction._new(-self._num, self._dom)
+		
+	def __pos__(self):
+		return self
+		
+	def __abs__(self):
+		return self if self._num >= 0 else Fraction._new(-self._num, self._dom)
+		
+	def _cross(self, other):
+		"""Returns the pair (a, b) such that comparing a with b compares this fraction with the number 'other'
+		Returns None if 'other' is not a number"""
+		if not isinstance(other, _numbers): return None
+		if isinstance(other, float) and (other != other or other in (float('inf'), float('-inf'))):
+			return self._num / self._dom, other
+		c, d = _ratio(other)
+		return self._num * d, c * self._dom
 		
 	def __lt__(self, other):
 		'''Allows the usage of the '<' operator with fractions'''
-		if self.dom != other.dom: other.makeSame(self)
-		return self.num < other.num
+		if isinstance(other, Fraction): return self._num * other._dom < other._num * self._dom
+		pair = self._cross(other)
+		return NotImplemented if pair is None else pair[0] < pair[1]
 		
 	def __le__(self, other):
 		'''Allows the usage of the '<=' operator with fractions'''
-		if self.dom != other.dom: other.makeSame(self)
-		return self.num <= other.num
+		if isinstance(other, Fraction): return self._num * other._dom <= other._num * self._dom
+		pair = self._cross(other)
+		return NotImplemented if pair is None else pair[0] <= pair[1]
 		
 	def __eq__(self, other):
 		'''Allows the usage of the '==' operator with fractions'''
-		if self.dom != other.dom: other.makeSame(self)
-		return self.num == other.num
+		if isinstance(other, Fraction): return self._num == other._num and self._dom == other._dom
+		pair = self._cross(other)
+		return NotImplemented if pair is None else pair[0] == pair[1]
 		
 	def __ne__(self, other):
 		'''Allows the usage of the '!=' operator with fractions'''
-		if self.dom != other.dom: other.makeSame(self)
-		return self.num != other.num
+		if isinstance(other, Fraction): return self._num != other._num or self._dom != other._dom
+		pair = self._cross(other)
+		return NotImplemented if pair is None else pair[0] != pair[1]
 	
 	def __gt__(self, other):
 		'''Allows the usage of the '>' operator with fractions'''
-		if self.dom != other.dom: other.makeSame(self)
-		return self.num > other.num
+		if isinstance(other, Fraction): return self._num * other._dom > other._num * self._dom
+		pair = self._cross(other)
+		return NotImplemented if pair is None else pair[0] > pair[1]
 		
 	def __ge__(self, other):
 		'''Allows the usage of the '>=' operator with fractions'''
-		if self.dom != other.dom: other.makeSame(self)
-		return self.num >= other.num
+		if isinstance(other, Fraction): return self._num * other._dom >= other._num * self._dom
+		pair = self._cross(other)
+		return NotImplemented if pair is None else pair[0] >= pair[1]
+		
+	def __hash__(self):
+		'''Hashes the fraction so that it can be a dictionary key; it hashes like the equal int, float, Decimal or fractions.Fraction'''
+		if _modulus is None: # Python 2 has no common numeric hash, so only equal fractions hash alike
+			try:
+				return hash(self._num / self._dom)
+			except OverflowError:
+				return hash(self._num // self._dom)
+		inverse = pow(self._dom, _modulus - 2, _modulus) # the modulus is prime, so this is 1/dom unless dom is a multiple of it
+		result = hash(abs(self._num)) * inverse % _modulus if inverse else sys.hash_info.inf
+		if self._num < 0: result = -result
+		return -2 if result == -1 else result
 		
 	def __getitem__(self, index):
 		'''Allows the usage of the [ ] operators with fractions'''
-		if index % 2 == 0: return self.num
-		else: return self.dom
+		if index % 2 == 0: return self._num
+		else: return self._dom
+		
+	def __iter__(self):
+		'''Allows unpacking a fraction into (numerator, denominator)'''
+		return iter((self._num, self._dom))
 		
 	def __nonzero__(self):
 		'''Returns a boolean if it is or isn't zero'''
-		if self.num == 0: return False
+		if self._num == 0: return False
 		else: return True
 		
-	__radd__ = lambda self, other: self.__add__(other)
-	__rsub__ = lambda self, other: self.__sub__(other)
-	__rmul__ = lambda self, other: self.__mul__(other)
-	__rdiv__ = lambda self, other: self.__div__(other)
+	__bool__ = __nonzero__
 		
 	def __repr__(self):
 		'''Creates a representation of the Fraction instance'''
-		return "<nums.Fraction.Fraction instance at {mem}>: {num}/{dom}".format(mem = hex(id(self)), num = self.num, dom = self.dom)
+		return "<nums.Fraction.Fraction instance at {mem}>: {num}/{dom}".format(mem = hex(id(self)), num = self._num, dom = self._dom)
 		
 	def __float__(self):
 		return self.decimal()
@@ -271,6 +416,293 @@ class Fraction(object):
 	def __int__(self):
 		return int(self.decimal())
 		
+	def limit_denominator(self, max_denominator = 1000000):
+		'''Returns the closest fraction whose denominator is at most 'max_denominator'
+		>>> Fraction(3141592653, 1000000000).limit_denominator(100)
+		<nums.Fraction.Fraction instance at 0x21ec7f0>: 311/99'''
+		return limit_denominator(self, max_denominator)
+		
+	def __reduce__(self):
+		'''Allows fractions to be pickled and copied'''
+		return (Fraction, (self._num, self._dom))
+		
+### Array of fractions
+
+_INT64 = 2**63 - 1
+
+def _pack(values):
+	"""Stores integers compactly: as int64 when they all fit, and as Python ints otherwise"""
+	numpy = _numpy()
+	if numpy is not None:
+		if isinstance(values, numpy.ndarray) and values.dtype == numpy.int64: return values
+		try:
+			return numpy.array(values, dtype = numpy.int64)
+		except OverflowError:
+			return numpy.array(values, dtype = object)
+	try:
+		return array('q', values)
+	except OverflowError:
+		return list(values)
+
+def _magnitude(values):
+	"""Returns the largest absolute value in 'values' (an array or a single int) as a Python int"""
+	numpy = _numpy()
+	if not hasattr(values, '__len__'): return abs(values)
+	if len(values) == 0: return 0
+	if numpy is not None: return max(int(numpy.max(values)), -int(numpy.min(values)))
+	return max(max(values), -min(values))
+
+def _widen(values):
+	"""Converts int64 storage to Python-int storage so that arithmetic on it cannot overflow"""
+	numpy = _numpy()
+	if numpy is not None: return values.astype(object) if isinstance(values, numpy.ndarray) else values
+	return list(values) if isinstance(values, array) else values
+
+class FractionArray(object):
+	"""Array of fractions, stored as two parallel arrays of numerators and (positive) denominators in lowest terms
+	The arrays are int64 (NumPy arrays, or array('q') without NumPy), and are promoted to Python ints when a value overflows.
+	Arithmetic and comparisons work elementwise with another FractionArray of the same length, a Fraction, or a number.
+	>>> a = FractionArray([1, 2, 3], [2, 3, 4])
+	>>> a + Fraction(1, 2)
+	<nums.Fraction.FractionArray instance at 0x7f3c2a1c9f10>: [1/1, 7/6, 5/4]
+	>>> a.sum()
+	<nums.Fraction.Fraction instance at 0x7f3c2a1c9f70>: 23/12"""
+	
+	def __init__(self, numerators, denominators = None):
+		"""Creates the array numerators[i] / denominators[i]
+		Without 'denominators', 'numerators' is an iterable of Fractions, numbers, or (numerator, denominator) pairs
+		>>> FractionArray([0.5, Fraction(1, 3), (2, 4)])
+		<nums.Fraction.FractionArray instance at 0x7f3c2a1c9f10>: [1/2, 1/3, 1/2]"""
+		numpy = _numpy()
+		if denominators is None:
+			if numpy is not None and isinstance(numerators, numpy.ndarray) and numerators.dtype.kind in 'iu':
+				numerators, denominators = numerators.astype(numpy.int64), numpy.ones(len(numerators), dtype = numpy.int64)
+			else:
+				pairs = [value if isinstance(value, tuple) else _ratio(value) for value in numerators]
+				numerators, denominators = [pair[0] for pair in pairs], [pair[1] for pair in pairs]
+		elif len(numerators) != len(denominators): 
+			raise NumericalError(value_("numerators and denominators must have the same length"))
+		self._nums, self._doms = self._normalize(_pack(numerators), _pack(denominators))
+		
+	@classmethod
+	def _new(cls, numerators, denominators):
+		"""Creates an array from storage that is already in lowest terms with positive denominators"""
+		self = object.__new__(cls)
+		self._nums, self._doms = numerators, denominators
+		return self
+		
+	@staticmethod
+	def _normalize(nums, doms):
+		"""Puts the fractions nums[i] / doms[i] in lowest terms with positive denominators"""
+		numpy = _numpy()
+		if numpy is not None:
+			if (doms == 0).any(): raise NumericalError(value_(getError('nonzero')))
+			negative = doms < 0
+			if negative.any():
+				nums, doms = numpy.where(negative, -nums, nums), numpy.where(negative, -doms, doms)
+			g = numpy.gcd(nums, doms)
+			return _pack(nums // g), _pack(doms // g)
+		reduced_nums, reduced_doms = [], []
+		for n, d in zip(nums, doms):
+			if d == 0: raise NumericalError(value_(getError('nonzero')))
+			if d < 0: n, d = -n, -d
+			g = _gcd(n, d)
+			reduced_nums.append(n // g)
+			reduced_doms.append(d // g)
+		return _pack(reduced_nums), _pack(reduced_doms)
+		
+	numerators = property(lambda self: self._nums, doc = "The array of numerators")
+	denominators = property(lambda self: self._doms, doc = "The array of (positive) denominators")
+	
+	def __len__(self):
+		return len(self._nums)
+		
+	def __getitem__(self, index):
+		'''Returns the Fraction at 'index', or a FractionArray for a slice'''
+		if isinstance(index, slice): return FractionArray._new(self._nums[index], self._doms[index])
+		return Fraction._new(int(self._nums[index]), int(self._doms[index]))
+		
+	def __iter__(self):
+		for n, d in zip(self._nums, self._doms):
+			yield Fraction._new(int(n), int(d))
+			
+	def fractions(self):
+		'''Returns a list of the Fractions in the array'''
+		return list(self)
+		
+	def __repr__(self):
+		'''Creates a representation of the FractionArray instance'''
+		values = ', '.join('{0}/{1}'.format(n, d) for n, d in zip(self._nums, self._doms))
+		return "<nums.Fraction.FractionArray instance at {mem}>: [{values}]".format(mem = hex(id(self)), values = values)
+		
+	def _operand(self, other):
+		"""Returns the numerators and denominators of 'other' (arrays, or ints for a single fraction or number)"""
+		if isinstance(other, FractionArray):
+			if len(other) != len(self): raise NumericalError(value_("arrays must have the same length"))
+			return other._nums, other._doms
+		if isinstance(other, Fraction): return other._num, other._dom
+		if isinstance(other, _numbers): return _ratio(other)
+		return None
+		
+	def _apply(self, other, operation):
+		"""Applies 'operation' elementwise between this array and 'other'"""
+		operand = self._operand(other)
+		if operand is None: raise NumericalError(type_("must be fraction, number, or FractionArray"))
+		a, b = self._nums, self._doms
+		c, d = operand
+		ma, mb, mc, md = [_magnitude(x) for x in (a, b, c, d)]
+		if operation in (_array_add, _array_subtract, _array_compare): bounds = (ma * md + mc * mb, mb * md)
+		elif operation is _array_multiply: bounds = (ma * mc, mb * md)
+		else: bounds = (ma * md, mb * mc)
+		if max(bounds) > _INT64: # the results could overflow int64, so compute them with Python ints
+			a, b, c, d = [_widen(x) for x in (a, b, c, d)]
+		return operation(a, b, c, d)
+		
+	def add(self, other):
+		'''Adds 'other' elementwise'''
+		return self._apply(other, _array_add)
+		
+	def subtract(self, other):
+		'''Subtracts 'other' elementwise'''
+		return self._apply(other, _array_subtract)
+		
+	def multiply(self, other):
+		'''Multiplies by 'other' elementwise'''
+		return self._apply(other, _array_multiply)
+		
+	def divide(self, other):
+		'''Divides by 'other' elementwise'''
+		return self._apply(other, _array_divide)
+		
+	def _operator(operation):
+		"""Makes an operator from an elementwise operation, returning NotImplemented for unsupported operands"""
+		def operator(self, other):
+			if self._operand(other) is None: return NotImplemented
+			return operation(self, other)
+		return operator
+		
+	__add__ = __radd__ = _operator(add)
+	__sub__ = _operator(subtract)
+	__mul__ = __rmul__ = _operator(multiply)
+	__div__ = __truediv__ = _operator(divide)
+	__rsub__ = _operator(lambda self, other: (-self).add(other))
+	__rtruediv__ = _operator(lambda self, other: self.reciprocal().multiply(other))
+	del _operator
+		
+	__rdiv__ = __rtruediv__
+		
+	def reciprocal(self):
+		'''Returns the array of reciprocals'''
+		return FractionArray._new(*FractionArray._normalize(self._doms, self._nums))
+		
+	def __neg__(self):
+		numpy = _numpy()
+		return FractionArray._new(-self._nums if numpy is not None else _pack([-n for n in self._nums]), self._doms)
+		
+	def _compare(self, other):
+		"""Returns the cross products to compare with 'other', or None if 'other' is not a number"""
+		if self._operand(other) is None: return None
+		return self._apply(other, _array_compare)
+		
+	def __lt__(self, other):
+		pair = self._compare(other)
+		return NotImplemented if pair is None else _elementwise(pair, lambda x, y: x < y)
+		
+	def __le__(self, other):
+		pair = self._compare(other)
+		return NotImplemented if pair is None else _elementwise(pair, lambda x, y: x <= y)
+		
+	def __eq__(self, other):
+		pair = self._compare(other)
+		return NotImplemented if pair is None else _elementwise(pair, lambda x, y: x == y)
+		
+	def __ne__(self, other):
+		pair = self._compare(other)
+		return NotImplemented if pair is None else _elementwise(pair, lambda x, y: x != y)
+		
+	def __gt__(self, other):
+		pair = self._compare(other)
+		return NotImplemented if pair is None else _elementwise(pair, lambda x, y: x > y)
+		
+	def __ge__(self, other):
+		pair = self._compare(other)
+		return NotImplemented if pair is None else _elementwise(pair, lambda x, y: x >= y)
+		
+	__hash__ = None # elementwise == makes arrays unhashable
+	
+	def _tree(self, combine, empty):
+		"""Reduces the array pairwise with 'combine' (halving its length each step) to a single Fraction"""
+		if len(self) == 0: return empty
+		values, extra = self, empty
+		while len(values) > 1:
+			if len(values) % 2: 
+				extra = combine(extra, values[-1])
+				values = values[:-1]
+			values = combine(values[0::2], values[1::2])
+		return combine(values[0], extra)
+		
+	def sum(self):
+		'''Returns the sum of the fractions as a Fraction'''
+		return self._tree(lambda x, y: x + y, Fraction._new(0, 1))
+		
+	def prod(self):
+		'''Returns the product of the fractions as a Fraction'''
+		return self._tree(lambda x, y: x * y, Fraction._new(1, 1))
+		
+	def reduce(self, operation):
+		'''Reduces the array to a single Fraction with 'operation' ('sum' or 'prod')'''
+		if operation not in ('sum', 'prod'): raise NumericalError(value_("operation must be 'sum' or 'prod'"))
+		return getattr(self, operation)()
+		
+	def decimal(self):
+		'''Returns the values of the fractions as an array of floats (a NumPy array, or array('d') without NumPy)'''
+		numpy = _numpy()
+		if numpy is None: return array('d', (n / d for n, d in zip(self._nums, self._doms)))
+		if self._nums.dtype == object or self._doms.dtype == object:
+			return numpy.array([n / d for n, d in zip(self._nums, self._doms)], dtype = float)
+		return self._nums / self._doms
+	
+def _elementwise(pair, compare):
+	"""Compares the arrays of a pair of cross products elementwise"""
+	numpy = _numpy()
+	x, y = pair
+	if numpy is not None: return compare(x, y)
+	return [compare(i, j) for i, j in zip(x, y)]
+	
+def _broadcast(*values):
+	"""Repeats the single ints among 'values' so that they can be zipped with the arrays (without NumPy)"""
+	return [itertools.repeat(value) if not hasattr(value, '__len__') else value for value in values]
+	
+def _array_add(a, b, c, d):
+	numpy = _numpy()
+	if numpy is not None: return FractionArray._new(*FractionArray._normalize(a * d + c * b, b * d))
+	a, b, c, d = _broadcast(a, b, c, d)
+	return FractionArray._new(*FractionArray._normalize([w * z + y * x for w, x, y, z in zip(a, b, c, d)], [x * z for x, z in zip(b, d)]))
+	
+def _array_subtract(a, b, c, d):
+	numpy = _numpy()
+	if numpy is not None: return FractionArray._new(*FractionArray._normalize(a * d - c * b, b * d))
+	a, b, c, d = _broadcast(a, b, c, d)
+	return FractionArray._new(*FractionArray._normalize([w * z - y * x for w, x, y, z in zip(a, b, c, d)], [x * z for x, z in zip(b, d)]))
+	
+def _array_multiply(a, b, c, d):
+	numpy = _numpy()
+	if numpy is not None: return FractionArray._new(*FractionArray._normalize(a * c, b * d))
+	a, b, c, d = _broadcast(a, b, c, d)
+	return FractionArray._new(*FractionArray._normalize([w * y for w, y in zip(a, c)], [x * z for x, z in zip(b, d)]))
+	
+def _array_divide(a, b, c, d):
+	numpy = _numpy()
+	if numpy is not None: return FractionArray._new(*FractionArray._normalize(a * d, b * c))
+	a, b, c, d = _broadcast(a, b, c, d)
+	return FractionArray._new(*FractionArray._normalize([w * z for w, z in zip(a, d)], [x * y for x, y in zip(b, c)]))
+	
+def _array_compare(a, b, c, d):
+	numpy = _numpy()
+	if numpy is not None: return a * d, c * b
+	a, b, c, d = _broadcast(a, b, c, d)
+	return [w * z for w, z in zip(a, d)], [y * x for x, y in zip(b, c)]
+		
 ### Module-level functions to manipulate Fractions
 		
 def addFractions(f1, f2):
@@ -293,14 +725,132 @@ def divideFractions(f1, f2):
 	if not isinstance(f1, Fraction) or not isinstance(f2, Fraction): raise NumericalError((getError('fraction')))
 	return f1.divide(f2)
 	
-def makeFraction(n):
-	'''Creates a fraction of "n/1" and simplifies it'''
+def _pairs(fractions):
+	"""Generates the (numerator, denominator) pairs, in lowest terms, of an iterable of Fractions and numbers
+	prod_fractions relies on the pairs being reduced: its tree only cancels across operands, never within one"""
+	for f in fractions:
+		if isinstance(f, Fraction): yield f._num, f._dom
+		elif isinstance(f, _numbers): yield _ratio(f)
+		else: raise NumericalError(type_("must be an iterable of fractions or numbers"))
+		
+def _tree(terms, combine):
+	"""Combines adjacent pairs of 'terms' level by level, so that operands of similar size are combined together"""
+	if not terms: return None
+	while len(terms) > 1:
+		combined = [combine(terms[i], terms[i + 1]) for i in range(0, len(terms) - 1, 2)]
+		if len(terms) % 2: combined.append(terms[-1])
+		terms = combined
+	return terms[0]
+	
+def _sum_pair(x, y):
+	"""Adds two fractions, keeping the least common denominator but not reducing the numerator"""
+	n1, d1 = x
+	n2, d2 = y
+	g = _gcd(d1, d2)
+	if g == 1: return n1 * d2 + n2 * d1, d1 * d2
+	return n1 * (d2 // g) + n2 * (d1 // g), (d1 // g) * d2
+	
+def _product_pair(x, y):
+	"""Multiplies two fractions in lowest terms, cancelling across them first (so the product is in lowest terms)"""
+	n1, d1 = x
+	n2, d2 = y
+	g1, g2 = _gcd(n1, d2), _gcd(n2, d1)
+	return (n1 // g1) * (n2 // g2), (d1 // g2) * (d2 // g1)
+	
+def sum_fractions(fractions):
+	"""Returns the exact sum of an iterable of Fractions (and numbers) as a Fraction
+	Numerators with the same denominator are added directly; the distinct denominators are then combined pairwise in a tree,
+	and the result is reduced once at the end. This is much faster than sum() for many fractions.
+	>>> sum_fractions(Fraction(1, k) for k in range(1, 11))
+	<nums.Fraction.Fraction instance at 0x21ec7f0>: 7381/2520"""
+	numerators = {}
+	for n, d in _pairs(fractions):
+		numerators[d] = numerators.get(d, 0) + n
+	total = _tree([(n, d) for d, n in numerators.items()], _sum_pair)
+	if total is None: return Fraction._new(0, 1)
+	n, d = total
+	g = _gcd(n, d)
+	return Fraction._new(n // g, d // g)
+	
+def prod_fractions(fractions):
+	"""Returns the exact product of an iterable of Fractions (and numbers) as a Fraction
+	The fractions are multiplied pairwise in a tree, so that the large numerators and denominators are only multiplied a few times
+	>>> prod_fractions(Fraction(k, k + 1) for k in range(1, 100))
+	<nums.Fraction.Fraction instance at 0x21ec7f0>: 1/100"""
+	total = _tree(list(_pairs(fractions)), _product_pair)
+	if total is None: return Fraction._new(1, 1)
+	n, d = total
+	return Fraction._new(-n, -d) if d < 0 else Fraction._new(n, d)
+	
+def _chunks(stream, chunk_size):
+	"""Generates text chunks from a string, bytes, a file object, or an iterable of strings or bytes"""
+	if hasattr(stream, 'read'):
+		chunk = stream.read(chunk_size)
+		while chunk:
+			yield chunk
+			chunk = stream.read(chunk_size)
+	elif isinstance(stream, (str, bytes)):
+		for start in range(0, len(stream), chunk_size):
+			yield stream[start:start + chunk_size]
+	else:
+		for chunk in stream:
+			yield chunk
+			
+def _parse_line(line, line_number):
+	"""Returns the reduced (numerator, denominator) pairs of the tokens in one line"""
+	pairs = []
+	for match in _expression('delimited').finditer(line):
+		token = match.group()
+		try:
+			if token.isdigit():
+				pairs.append((int(token), 1))
+				continue
+			numerator, slash, denominator = token.partition('/')
+			if numerator.isdigit() and denominator.isdigit() and denominator.strip('0'): # the common 'a/b' case
+				n, d = int(numerator), int(denominator)
+			else:
+				a, b = _parse_number(numerator), (_parse_number(denominator) if slash else (1, 1))
+				if a is None or b is None or b[0] == 0: raise ValueError(token)
+				n, d = a[0] * b[1], a[1] * b[0]
+				if d < 0: n, d = -n, -d
+		except ValueError as error: # int() also rejects non-ASCII digits
+			problem = "exponent larger than {0} in".format(_MAX_EXPONENT) if isinstance(error, _ExponentError) else "malformed fraction"
+			raise NumericalError(value_("{problem} '{token}' at line {line}, column {column}".format(problem = problem, token = token, 
+				line = line_number, column = match.start() + 1)))
+		g = _gcd(n, d)
+		pairs.append((n // g, d // g) if g != 1 else (n, d))
+	return pairs
+	
+def parse_fractions(stream, pairs = False, chunk_size = 65536):
+	"""Generates the Fractions in text, parsed exactly
+	'stream' is a string, bytes, a file object (text or binary), or an iterable of strings or bytes; it is read in chunks.
+	Tokens are integers ('-3'), decimals ('0.25', '1e-3') or fractions ('1/5', '2.5/3'), separated by whitespace or commas.
+	A malformed token, or an exponent larger than 10000 in absolute value, raises a NumericalError with its line and column.
+	With 'pairs', (numerator, denominator) tuples are generated instead, which a FractionArray accepts directly.
+	>>> list(parse_fractions('1/5, 0.25\\n-3'))
+	[<nums.Fraction.Fraction instance at 0x21ec7f0>: 1/5, <nums.Fraction.Fraction instance at 0x21ec810>: 1/4, <nums.Fraction.Fraction instance at 0x21ec830>: -3/1]
+	>>> FractionArray(parse_fractions(open('values.csv', 'rb'), pairs = True))"""
+	line_number, pending = 0, ''
+	for chunk in _chunks(stream, chunk_size):
+		if not isinstance(chunk, str): chunk = chunk.decode('latin-1') # the tokens are ASCII
+		lines = (pending + chunk).split('\n')
+		pending = lines.pop()
+		for line in lines:
+			line_number += 1
+			for pair in _parse_line(line, line_number):
+				yield pair if pairs else Fraction._new(*pair)
+	if pending:
+		for pair in _parse_line(pending, line_number + 1):
+			yield pair if pairs else Fraction._new(*pair)
+			
+def makeFraction(n, max_denominator = None):
+	'''Creates a simplified fraction of "n"; floats use their shortest decimal representation, so makeFraction(0.1) is 1/10
+	With 'max_denominator', the closest fraction whose denominator is at most 'max_denominator' is returned instead
+	>>> makeFraction(3.14159, 1000)
+	<nums.Fraction.Fraction instance at 0x21ec7f0>: 355/113'''
 	if not isinstance(n, types): raise NumericalError((getError('num')))
-	x = 1
-	if isinstance(n, FloatType):
-		x = 10 ** (len(str(n).split('.')[1]))
-	f = Fraction(n * x, x)
-	return Fraction(*f.simplify())
+	if max_denominator is not None: return limit_denominator(n, max_denominator)
+	return Fraction(repr(n)) if isinstance(n, float) else Fraction(n)
 	
 def makeSimpleFraction(n):
 	'''Creates a fraction of "n/1"'''
@@ -308,26 +858,50 @@ def makeSimpleFraction(n):
 	return Fraction(n, 1)
 	
 def continuedFraction(n):
-	'''Creates a continued fraction of "n"'''
-	pass
-	
-# from __future__ import division
-# from nums.Fraction import *
-
-# '''see http://en.wikipedia.org/wiki/Continued_fraction'''
-
-# def continuedFraction(d, frac = []):
-	# if d.num == 0 or d.dom == 0: return []
-	# n = makeFraction(int(d.num/d.dom)) # gets stuck here
-	# d = makeFraction(d.num/d.dom)
-	# print d, n # testing purposes
-	# frac.append(int(n.num))
-	# d -= n
-	# d = d.reciprocal()
-	# print '\t', d, n, '\n' # testing purposes
-	# return frac + (continuedFraction(d, frac))
-
-# print continuedFraction(makeSimpleFraction(3.245))
+	'''Generates the terms of the continued fraction of "n" (a Fraction or number), which is exact and always ends
+	See http://en.wikipedia.org/wiki/Continued_fraction
+	>>> list(continuedFraction(Fraction(415, 93)))
+	[4, 2, 6, 7]
+	>>> list(continuedFraction(0.75))
+	[0, 1, 3]'''
+	if not isinstance(n, _numbers + (Fraction,)): raise NumericalError(type_(getError('num')))
+	p, q = _ratio(n)
+	while q:
+		a = p // q
+		yield a
+		p, q = q, p - a * q
+		
+def convergents(n):
+	'''Generates the convergents of "n" (a Fraction or number), or of an iterable of continued fraction terms, as Fractions
+	The terms are used lazily, so an endless iterable of terms gives an endless stream of convergents
+	>>> [f.fraction() for f in convergents(Fraction(415, 93))]
+	[(4, 1), (9, 2), (58, 13), (415, 93)]'''
+	terms = continuedFraction(n) if isinstance(n, _numbers + (Fraction, str)) else n
+	h0, h1, k0, k1 = 0, 1, 1, 0
+	for a in terms:
+		h0, h1 = h1, a * h1 + h0
+		k0, k1 = k1, a * k1 + k0
+		yield Fraction._new(h1, k1)
+		
+def limit_denominator(n, max_denominator = 1000000):
+	'''Returns the closest Fraction to "n" (a Fraction or number) whose denominator is at most 'max_denominator'
+	>>> limit_denominator(3.141592653589793, 1000)
+	<nums.Fraction.Fraction instance at 0x21ec7f0>: 355/113'''
+	if not isinstance(n, _numbers + (Fraction,)): raise NumericalError(type_(getError('num')))
+	if max_denominator < 1: raise NumericalError(value_("max_denominator must be at least 1"))
+	value = n if isinstance(n, Fraction) else Fraction(n)
+	if value._dom <= max_denominator: return value
+	p0, q0, p1, q1 = 0, 1, 1, 0
+	p, q = value._num, value._dom
+	while True: # convergents until the next denominator is too large
+		a = p // q
+		q2 = q0 + a * q1
+		if q2 > max_denominator: break
+		p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+		p, q = q, p - a * q
+	k = (max_denominator - q0) // q1
+	semiconvergent, convergent = Fraction(p0 + k * p1, q0 + k * q1), Fraction._new(p1, q1)
+	return convergent if abs(convergent - value) <= abs(semiconvergent - value) else semiconvergent
 	
 ### Examples to display the module's capabilities
 		
@@ -26,7 +26,6 @@ LICENSE:
 		http://www.gnu.org/licenses/gpl.html
 	To open the license, run 'nums.__init__.license()'.
 '''
-import webbrowser
 
 ### Change Log:
 
@@ -41,13 +40,92 @@ To do:
 
 ### All functions, classes, and modules
 
-modules = ['number_theory.py', 'sequences.py', 'bases.py', 'Fraction.py', 'errors.py']
+modules = ['number_theory.py', 'sequences.py', 'figurate.py', 'combinatorics.py', 'bases.py', 'Fraction.py', 'errors.py', 'instrument.py', 'aio.py']
 
-from nums.number_theory import *
-from nums.sequences import *
-from nums.Fraction import *
-from nums.errors import *
-from nums.bases import *
+import types as _types
+import sys as _sys
+import os as _os
+
+try:
+	_input = raw_input
+except NameError:
+	_input = input # Python 3
+
+### Lazy loading
+# 'import nums' only runs this file. Each public name is imported from its submodule the first time it is used (PEP 562),
+# so a script that only calls nums.isPrime never loads the Fraction, decimal or symbolic-differentiation code.
+# Python versions without module __getattr__ (before 3.7) import every submodule up front instead.
+
+_submodules = ('number_theory', 'sequences', 'figurate', 'combinatorics', 'Fraction', 'errors', 'bases') # later modules shadow earlier ones
+
+_public = {
+'number_theory': ('arith_sum', 'commonFactors', 'cosD', 'cosR', 'decCos', 'decE', 'decExp', 'decPi', 'decSin', 'decTan', 'degToRad',
+	'e', 'factors', 'gaussSum', 'gcf', 'integral', 'pFactors', 'pi', 'power_sum', 'quadForm', 'quadForm_many', 'radToDeg', 'round',
+	'sinD', 'sinR', 'tanD', 'tanR', 'tau', 'triangleArea'),
+'sequences': ('collatz', 'decRange', 'fib', 'generate_primes', 'isCollatz', 'isPrime', 'n_primes', 'prevFibs', 'prevPrimes',
+	'prevTriNums', 'prime', 'primeRange', 'prime_range', 'sieve', 'triNum'),
+'figurate': ('hexagonal', 'is_hexagonal', 'is_pentagonal', 'is_polygonal', 'is_square', 'is_triangular', 'pentagonal', 'polygonal',
+	'polygonal_count', 'polygonal_index', 'polygonal_range', 'square', 'triangular'),
+'combinatorics': ('binomial', 'binomial_mod', 'factorial', 'multinomial'),
+'Fraction': ('Fraction', 'FractionArray', 'addFractions', 'continuedFraction', 'convergents', 'divideFractions', 'division', 'example',
+	'limit_denominator', 'makeFraction', 'makeSimpleFraction', 'multiplyFractions', 'parse_fractions', 'prod_fractions',
+	'subtractFractions', 'sum_fractions'),
+'errors': ('NumericalError', 'getError', 'setTrusted', 'trusted', 'type_', 'value_'),
+'bases': ('Function', 'math_eval'),
+}
+
+_names = dict((name, module) for module in _submodules for name in _public[module])
+_extras = ('instrument', 'aio') # submodules that are only reached as nums.<module>, not star-imported
+_own = ('modules', 'information', 'license', 'platforms')
+
+def _submodule(module):
+	"""Imports and returns the submodule nums.<module>"""
+	__import__('nums.' + module)
+	return _sys.modules['nums.' + module]
+
+def _import_all():
+	"""Imports every submodule, binding their public names as 'from nums.<module> import *' would"""
+	namespace = globals()
+	for module in _submodules:
+		for name, value in vars(_submodule(module)).items():
+			if not name.startswith('_') and name not in _own: namespace[name] = value
+
+def __getattr__(name):
+	"""Imports the public name 'name' from its submodule on first use"""
+	if name in _names:
+		value = getattr(_submodule(_names[name]), name)
+		globals()[name] = value
+		return value
+	if name in _extras: return _submodule(name)
+	if name.startswith('__') and name != '__all__': raise AttributeError(name)
+	_import_all() # names that are not in the table, such as the 'types' aliases re-exported by the star imports
+	if name not in globals(): raise AttributeError("module 'nums' has no attribute " + repr(name))
+	return globals()[name]
+
+def __dir__():
+	"""Lists the public names, including the ones that have not been imported yet"""
+	return sorted(set(globals()) | set(_names))
+
+class _Package(_types.ModuleType):
+	"""Module type of the 'nums' package"""
+	def __setattr__(self, name, value):
+		# importing nums.Fraction binds the submodule on the package, but nums.Fraction has always been the Fraction class
+		if name == 'Fraction' and isinstance(value, _types.ModuleType): value = value.Fraction
+		_types.ModuleType.__setattr__(self, name, value)
+
+if _sys.version_info >= (3, 7):
+	_sys.modules[__name__].__class__ = _Package
+else:
+	from nums.number_theory import *
+	from nums.sequences import *
+	from nums.figurate import *
+	from nums.combinatorics import *
+	from nums.Fraction import *
+	from nums.errors import *
+	from nums.bases import *
+
+if _os.environ.get('NUMS_INSTRUMENT', '') not in ('', '0'):
+	_submodule('instrument').enable()
 
 ### Package information
 	
@@ -89,11 +167,13 @@ def information():
 def license():
 	'''Displays license of nums'''
 	print(_license)
-	raw_input('\nPress enter to open GNU/GPL')
+	import webbrowser
+	_input('\nPress enter to open GNU/GPL')
 	webbrowser.open_new_tab('http://www.gnu.org/licenses/gpl.html')
 	
 def platforms():
 	'''Displays the platforms that 'nums' supports'''
 	print(_platforms)
-	raw_input('\nPress enter to open python.org')
+	import webbrowser
+	_input('\nPress enter to open python.org')
 	webbrowser.open_new_tab('http://python.org/download/')
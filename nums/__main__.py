@@ -0,0 +1,240 @@
+# nums.__main__.py
+# written by Rushy Panchal
+# Version 1.0
+
+'''Command-line interface of the 'nums' package
+
+'python -m nums <command>' runs the 'nums' functions over many inputs, on a pool of processes, writing the results as they are ready.
+
+OVERVIEW:
+	The commands are:
+		isprime [N ...]             prints 'N: True' or 'N: False' for each N
+		factor [N ...]              prints 'N: p1 p2 ...', the prime factors of each N
+		fib [N ...]                 prints 'N: fib(N)' for each N
+		integrate [EXPR ...]        prints 'EXPR: integral' for each expression of 'x' (see --start, --stop, -n and --method)
+		primes A B                  prints the primes from A to B, one per line
+		collatz-stats N             prints the longest and mean Collatz sequence lengths for the numbers from 1 to N
+	The commands that take inputs read them from standard input when none are given on the command line: one per line,
+	or, with --binary, as little-endian unsigned 64-bit integers. Inputs are read in chunks of --chunk, and the chunks are processed on --jobs processes
+	(all the cores by default) with a bounded number in flight, so memory use does not depend on the length of the input.
+	The results are written in the order of the inputs, a chunk at a time. Inputs that cannot be processed print 'INPUT: error: ...' on standard error and set the exit status to 1.
+	Example:
+
+	-------------------------------------------------------
+	seq 1 1000000 | python -m nums isprime -j 4 > primality.txt
+	python -m nums factor 600851475143 144
+	python -m nums primes 1000000 1000100
+	python -m nums integrate 'x**2' 'sin(x)' --stop 3 -n 10000 --method simpsons
+	-------------------------------------------------------
+'''
+
+### Change Log:
+
+	# v1.0: Initial release
+
+import multiprocessing
+import collections
+import itertools
+import argparse
+import struct
+import errno
+import sys
+
+from nums.errors import *
+from nums.sequences import fib, sieve, _isPrime, _sieve_segment
+from nums.number_theory import integral, _pFactors
+from nums.figurate import _isqrt
+
+### Commands
+# Each command maps an input (and the command's options) to a result in a worker process
+
+def _integer(token):
+	"""Returns an input as an int; binary inputs already are"""
+	return token if isinstance(token, int) else int(token)
+
+def _isprime(token, options):
+	"""Tests an input for primality"""
+	n = _integer(token)
+	return '{0}: {1}'.format(n, _isPrime(n))
+
+def _factor(token, options):
+	"""Factors an input into primes"""
+	n = _integer(token)
+	if n < 1: raise ValueError('must be greater than 1')
+	return '{0}: {1}'.format(n, ' '.join(str(p) for p in _pFactors(n)))
+
+def _fib(token, options):
+	"""Returns the Fibonacci number of an input"""
+	n = _integer(token)
+	if n < 1: raise ValueError('must be greater than 0')
+	return '{0}: {1}'.format(n, fib(n))
+
+def _integrate(expression, options):
+	"""Integrates an expression of 'x' with the options (n, start, stop, method)"""
+	n, start, stop, method = options
+	return '{0}: {1!r}'.format(expression, integral(expression, n, start, stop, method))
+
+_shared = {} # data that every worker needs, set once per process by _initialize instead of being sent with each job
+
+def _initialize(primes):
+	"""Stores the primes up to the square root of the largest number sieved by the 'primes' command"""
+	_shared['primes'] = primes
+
+def _primes(segment, options):
+	"""Returns the primes in the segment [low, high), one per line"""
+	return '\n'.join(str(p) for p in _sieve_segment(segment[0], segment[1], _shared['primes']))
+
+def _collatz_stats(segment, options):
+	"""Returns (most steps, the first number with that many steps, total steps) for the numbers in the segment
+	A sequence stops as soon as it drops to a number of the segment that has already been counted"""
+	low, high = segment
+	steps, longest, start = [], -1, low
+	for n in xrange(low, high):
+		count, m = 0, n
+		while m != 1:
+			if low <= m < n:
+				count += steps[m - low]
+				break
+			m = m >> 1 if m & 1 == 0 else 3 * m + 1
+			count += 1
+		steps.append(count)
+		if count > longest: longest, start = count, n
+	return longest, start, sum(steps)
+
+_commands = {'isprime': _isprime, 'factor': _factor, 'fib': _fib, 'integrate': _integrate, 'primes': _primes, 'collatz-stats': _collatz_stats}
+
+def _work(job):
+	"""Runs a command over a chunk of inputs; returns the results (None for the inputs that failed) and the error messages"""
+	command, items, options = job
+	function, results, errors = _commands[command], [], []
+	for item in items:
+		try:
+			results.append(function(item, options))
+		except Exception as error: # a bad input is reported on its own line instead of stopping the batch
+			results.append(None)
+			errors.append('{0}: error: {1}'.format(item, error))
+	return results, errors
+
+### Input and output
+
+def _lines(stream):
+	"""Yields the non-blank lines of a text stream"""
+	for line in stream:
+		line = line.strip()
+		if line: yield line
+
+def _records(stream, size = 1 << 16):
+	"""Yields the little-endian unsigned 64-bit integers of a binary stream"""
+	buffered = b''
+	while True:
+		data = stream.read(8 * size)
+		if not data: break
+		buffered += data
+		count = len(buffered) // 8
+		for value in struct.unpack('<{0}Q'.format(count), buffered[:8 * count]):
+			yield value
+		buffered = buffered[8 * count:]
+	if buffered: raise NumericalError(value_('the binary input is not a whole number of 8-byte integers'))
+
+def _chunks(iterable, size):
+	"""Groups an iterable into lists of 'size' items"""
+	iterator = iter(iterable)
+	while True:
+		chunk = list(itertools.islice(iterator, size))
+		if not chunk: break
+		yield chunk
+
+def _pipeline(jobs, processes, initargs = None):
+	"""Yields the results of _work for each job in order, running them on 'processes' processes (or in this process if it is 1)
+	At most two jobs per process are in flight, so the jobs are only read as fast as they are processed. 'initargs' is passed to _initialize in every process"""
+	if processes == 1:
+		if initargs is not None: _initialize(*initargs)
+		for job in jobs:
+			yield _work(job)
+		return
+	if initargs is None: pool = multiprocessing.Pool(processes)
+	else: pool = multiprocessing.Pool(processes, _initialize, initargs)
+	pending = collections.deque()
+	try:
+		for job in jobs:
+			pending.append(pool.apply_async(_work, (job,)))
+			if len(pending) >= 2 * processes: yield pending.popleft().get()
+		while pending:
+			yield pending.popleft().get()
+	except BaseException:
+		pool.terminate()
+		raise
+	pool.close()
+	pool.join()
+
+def _parser():
+	"""Returns the argument parser of the command-line interface"""
+	common = argparse.ArgumentParser(add_help = False)
+	common.add_argument('-j', '--jobs', type = int, default = 0, help = 'number of processes (default: the number of cores)')
+	common.add_argument('-c', '--chunk', type = int, default = 1 << 12, help = 'inputs per task (numbers per task for collatz-stats, and at least 2**20 for primes)')
+	parser = argparse.ArgumentParser(prog = 'python -m nums', description = 'Runs the nums functions over many inputs.')
+	commands = parser.add_subparsers(dest = 'command', metavar = 'command')
+	commands.required = True
+	for name, description in (('isprime', 'test whether each N is prime'), ('factor', 'print the prime factors of each N'),
+		('fib', 'print the Nth Fibonacci number for each N')):
+		command = commands.add_parser(name, parents = [common], help = description)
+		command.add_argument('numbers', nargs = '*', metavar = 'N', help = 'numbers (default: read from standard input)')
+		command.add_argument('--binary', action = 'store_true', help = 'read standard input as little-endian unsigned 64-bit integers')
+	command = commands.add_parser('integrate', parents = [common], help = 'integrate each expression of x')
+	command.add_argument('numbers', nargs = '*', metavar = 'EXPR', help = 'expressions (default: one per line of standard input)')
+	command.add_argument('--start', type = float, default = 0)
+	command.add_argument('--stop', type = float, default = 100)
+	command.add_argument('-n', type = int, default = 1000, help = 'number of shapes')
+	command.add_argument('--method', default = 'trapezoid', choices = ('left', 'middle', 'right', 'trapezoid', 'simpsons'))
+	command = commands.add_parser('primes', parents = [common], help = 'print the primes from A to B')
+	command.add_argument('a', type = int, metavar = 'A')
+	command.add_argument('b', type = int, metavar = 'B')
+	command = commands.add_parser('collatz-stats', parents = [common], help = 'summarize the Collatz sequences of the numbers from 1 to N')
+	command.add_argument('n', type = int, metavar = 'N')
+	return parser
+
+### Main function
+
+def main(arguments = None):
+	"""Runs the command-line interface; returns the exit status"""
+	args = _parser().parse_args(arguments)
+	if args.chunk < 1: raise SystemExit('python -m nums: error: --chunk must be greater than 0')
+	processes, status, initargs = args.jobs or multiprocessing.cpu_count(), 0, None
+	if args.command == 'primes':
+		a, b = max(2, args.a), args.b
+		initargs = (sieve(_isqrt(b)) if b >= 2 else [],)
+		size = max(args.chunk, _isqrt(max(b, 0)), 1 << 20) # every segment goes through all the base primes, so small ones are slow
+		jobs = (('primes', [(low, min(low + size, b + 1))], None) for low in xrange(a, b + 1, size))
+	elif args.command == 'collatz-stats':
+		if args.n < 1: raise SystemExit('python -m nums: error: N must be greater than 0')
+		jobs = (('collatz-stats', [(low, min(low + args.chunk, args.n + 1))], None) for low in xrange(1, args.n + 1, args.chunk))
+	else:
+		if args.numbers: items = args.numbers
+		elif getattr(args, 'binary', False): items = _records(getattr(sys.stdin, 'buffer', sys.stdin))
+		else: items = _lines(sys.stdin)
+		options = (args.n, args.start, args.stop, args.method) if args.command == 'integrate' else None
+		jobs = ((args.command, chunk, options) for chunk in _chunks(items, args.chunk))
+	longest, start, total = -1, 1, 0
+	try:
+		for results, errors in _pipeline(jobs, processes, initargs):
+			if args.command == 'collatz-stats':
+				for steps, n, count in results:
+					if steps > longest: longest, start = steps, n
+					total += count
+				continue
+			output = '\n'.join(result for result in results if result)
+			if output: sys.stdout.write(output + '\n')
+			if errors:
+				sys.stderr.write('\n'.join(errors) + '\n')
+				status = 1
+			sys.stdout.flush()
+		if args.command == 'collatz-stats':
+			sys.stdout.write('numbers: 1 to {0}\nlongest: {1} ({2} steps)\nmean steps: {3}\n'.format(args.n, start, longest, total / float(args.n)))
+	except KeyboardInterrupt:
+		return 130
+	except IOError as error: # the reader closed the pipe, as 'head' does
+		if error.errno != errno.EPIPE: raise
+	return status
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,188 @@
+# nums.aio.py
+# written by Rushy Panchal
+# Version 1.0
+
+'''Provides awaitable versions of the long-running 'nums' functions
+
+'nums.aio.py' runs primeRange, pFactors, integral and collatz on a thread or process pool, so that they can be awaited without blocking an asyncio event loop.
+
+OVERVIEW:
+	'nums.aio.py' is a module in the 'nums' package (for Python 3 only) that runs the same kernels as the synchronous functions on an executor,
+	only splitting their input into chunks: primeRange sieves consecutive segments, pFactors trial-divides consecutive ranges of divisors,
+	integral sums consecutive runs of samples, and collatz continues the sequence a run of terms at a time.
+	The event loop regains control between chunks, which is where the work can be cancelled,
+	where the 'timeout' is checked, and where the 'progress' callback is called with (done, total).
+	The 'executor' argument is 'thread' (the default), 'process', or any concurrent.futures.Executor. The thread and process pools are created
+	the first time they are used and shared by every call; shutdown() closes them. A process pool runs segments of primeRange and integral in parallel,
+	but functions given to integral must then be strings or picklable module-level functions.
+	Example of the module's capabilities (run nums.aio.example() to see this example):
+
+	-------------------------------------------------------
+	import asyncio
+	from nums import aio
+	async def main():
+		primes = await aio.primeRange(10**6, 10**6 + 100)
+		factors = await aio.pFactors(600851475143, timeout = 10)
+		area = await aio.integral('x**2', n = 10**6, stop = 3, progress = print)
+		print(primes, factors, area)
+	asyncio.run(main())
+	-------------------------------------------------------
+'''
+
+### Change Log:
+
+	# v1.0: Initial release
+
+import concurrent.futures
+import collections
+import asyncio
+
+from nums.errors import *
+from nums.errors import _validation, _integer
+from nums.sequences import sieve, _collatz, _sieve_segment
+from nums.number_theory import _trialDivision, _integral_arguments, _integral, _samples, _area
+from nums.figurate import _isqrt
+
+_pools = {}
+
+### Internal functions
+
+def _executor(executor):
+	"""Returns the executor to use: a shared pool for 'thread' or 'process', or the given Executor"""
+	if isinstance(executor, concurrent.futures.Executor): return executor
+	if executor not in ('thread', 'process'): raise NumericalError(value_("executor must be 'thread', 'process' or an Executor"))
+	if executor not in _pools:
+		_pools[executor] = concurrent.futures.ThreadPoolExecutor() if executor == 'thread' else concurrent.futures.ProcessPoolExecutor()
+	return _pools[executor]
+
+def _workers(executor):
+	"""Returns how many chunks to keep in flight on 'executor' """
+	return getattr(executor, '_max_workers', None) or 4
+
+async def _report(progress, done, total):
+	"""Calls the progress callback, awaiting it if it is a coroutine function"""
+	if progress is not None:
+		result = progress(done, total)
+		if asyncio.iscoroutine(result): await result
+
+async def _gather(executor, function, chunks, sizes, progress, total):
+	"""Runs function(*chunk) for each chunk on 'executor', keeping one chunk in flight per worker, and returns the results in order
+	After each chunk, 'progress' is called with the sum of the 'sizes' of the chunks done so far. Cancelling the task cancels the chunks that have not started"""
+	loop = asyncio.get_running_loop()
+	results, pending = [], collections.deque()
+	async def collect():
+		results.append(await pending.popleft())
+		await _report(progress, sum(sizes[:len(results)]), total)
+	try:
+		for chunk in chunks:
+			pending.append(loop.run_in_executor(executor, function, *chunk))
+			if len(pending) >= _workers(executor): await collect()
+		while pending:
+			await collect()
+	finally:
+		for future in pending:
+			future.cancel()
+	return results
+
+async def _timed(coroutine, timeout):
+	"""Awaits 'coroutine', raising asyncio.TimeoutError after 'timeout' seconds (if not None)"""
+	if timeout is None: return await coroutine
+	return await asyncio.wait_for(coroutine, timeout)
+
+### Main functions
+
+async def primeRange(a, b = None, chunk = 2**20, executor = 'thread', timeout = None, progress = None):
+	"""Returns the primes from 'a' to 'b' (inclusive), or up to 'a' if 'b' is not given, with a segmented Sieve of Eratosthenes
+	Each segment of 'chunk' numbers is sieved separately, using the primes up to the square root of 'b'
+	>>> asyncio.run(primeRange(10, 30))
+	[11, 13, 17, 19, 23, 29]"""
+	if b is None: a, b = 2, a
+	a, b = max(2, _integer(a)), _integer(b)
+	if chunk < 1: raise NumericalError(value_(getError('greaterthanzero')))
+	if b < a: return []
+	pool = _executor(executor)
+	async def work():
+		loop = asyncio.get_running_loop()
+		primes = await loop.run_in_executor(pool, sieve, _isqrt(b))
+		segments = [(low, min(low + chunk, b + 1), primes) for low in range(a, b + 1, chunk)]
+		results = await _gather(pool, _sieve_segment, segments, [high - low for low, high, primes in segments], progress, b + 1 - a)
+		return [p for segment in results for p in segment]
+	return await _timed(work(), timeout)
+
+async def pFactors(n, chunk = 10**6, executor = 'thread', timeout = None, progress = None):
+	"""Returns the prime factors of 'n', by trial division in chunks of 'chunk' divisors
+	The progress is reported as (largest divisor tried, square root of 'n')
+	>>> asyncio.run(pFactors(144))
+	[2, 2, 2, 2, 3, 3]"""
+	n = _integer(n)
+	if n < 1: raise NumericalError(value_('must be greater than 1'))
+	if chunk < 1: raise NumericalError(value_(getError('greaterthanzero')))
+	pool, span = _executor(executor), 6 * ((chunk + 1) // 2)
+	async def work():
+		loop = asyncio.get_running_loop()
+		factors, left, low, total = [], n, 5, _isqrt(n)
+		while True:
+			found, left = await loop.run_in_executor(pool, _trialDivision, left, low, low + span)
+			factors.extend(found)
+			low += span
+			if low * low > left: break
+			await _report(progress, min(low, total), total)
+		if left > 1: factors.append(left)
+		await _report(progress, total, total)
+		return factors
+	return await _timed(work(), timeout)
+
+async def integral(f, n = 1000, start = 0, stop = 100, method = 't', return_shapes = False, chunks = None, executor = 'thread', timeout = None, progress = None):
+	"""Returns nums.integral(f, n, start, stop, method, return_shapes), with the samples split into 'chunks' consecutive runs on the executor
+	By default there are four runs per worker (at most one per sample); the runs add up to the same sums as nums.integral, up to rounding.
+	Progress is reported as (samples done, number of samples)
+	>>> asyncio.run(integral('x**2', n = 10000, stop = 3, method = 's', chunks = 4))
+	8.99999999999999"""
+	n, method = _integral_arguments(f, n, start, stop, method, return_shapes)
+	if chunks is not None and chunks < 1: raise NumericalError(value_(getError('greaterthanzero')))
+	pool = _executor(executor)
+	first, last = _samples(method, n)
+	chunks = max(1, min(chunks or 4 * _workers(pool), last - first))
+	edges = [first + (last - first) * i // chunks for i in range(chunks + 1)]
+	runs = [(f, n, start, stop, method, low, high, return_shapes) for low, high in zip(edges, edges[1:])]
+	async def work():
+		results = await _gather(pool, _integral, runs, [high - low for low, high in zip(edges, edges[1:])], progress, last - first)
+		area = _area(method, (stop - start) / n, sum(total for total, shapes in results))
+		return (area, [shape for total, shapes in results for shape in shapes]) if return_shapes else area
+	return await _timed(work(), timeout)
+
+async def collatz(n, chunk = 500, executor = 'thread', timeout = None, progress = None):
+	"""Returns nums.collatz(n), computing 'chunk' terms at a time on the executor; progress is reported as (terms, None)
+	>>> asyncio.run(collatz(6))
+	[6, 3.0, 10.0, 5.0, 16.0, 8.0, 4.0, 2.0, 1.0]"""
+	if _validation.enabled and not isinstance(n, types): raise NumericalError(type_(getError('int')))
+	if chunk < 1: raise NumericalError(value_(getError('greaterthanzero')))
+	pool = _executor(executor)
+	async def work():
+		loop, terms, left = asyncio.get_running_loop(), [n], 5001 # the number of steps nums.collatz takes at most
+		while terms[-1] != 1 and left:
+			found = await loop.run_in_executor(pool, _collatz, terms[-1], min(chunk, left))
+			terms.extend(found)
+			left -= len(found)
+			await _report(progress, len(terms), None)
+		return terms
+	return await _timed(work(), timeout)
+
+def shutdown(wait = True):
+	"""Shuts down the shared thread and process pools; they are created again when they are next needed"""
+	while _pools:
+		_pools.popitem()[1].shutdown(wait)
+
+### Example to show the module's capabilities
+
+def example():
+	"""Example of the module's capabilities"""
+	async def main():
+		print('Primes from 10**6 to 10**6 + 100: ', await primeRange(10**6, 10**6 + 100))
+		print('Prime factors of 600851475143: ', await pFactors(600851475143, timeout = 10))
+		print('Integral of x**2 from 0 to 3: ', await integral('x**2', n = 10**6, stop = 3, method = 's'))
+		print('Length of the Collatz sequence of 27: ', len(await collatz(27)))
+	asyncio.run(main())
+
+if __name__ == '__main__':
+	help('nums.aio')
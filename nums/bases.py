@@ -8,10 +8,21 @@ nums.bases.py contains various classes and base structures to be used in the num
 
 These are meant to be used internally, but can be used directly if needed.'''
 
-import inspect
 import types
 import math
-import re
+from array import array
+from nums.errors import _numpy
+
+### NumPy equivalents of the 'math' functions
+
+_ufuncs = {'acos': 'arccos', 'acosh': 'arccosh', 'asin': 'arcsin', 'asinh': 'arcsinh', 'atan': 'arctan', 'atan2': 'arctan2', 
+'atanh': 'arctanh', 'cbrt': 'cbrt', 'ceil': 'ceil', 'copysign': 'copysign', 'cos': 'cos', 'cosh': 'cosh', 'degrees': 'degrees', 
+'exp': 'exp', 'exp2': 'exp2', 'expm1': 'expm1', 'fabs': 'fabs', 'floor': 'floor', 'fmod': 'fmod', 'gcd': 'gcd', 'hypot': 'hypot', 
+'isfinite': 'isfinite', 'isinf': 'isinf', 'isnan': 'isnan', 'lcm': 'lcm', 'ldexp': 'ldexp', 'log10': 'log10', 'log1p': 'log1p', 
+'log2': 'log2', 'pow': 'power', 'radians': 'radians', 'sin': 'sin', 'sinh': 'sinh', 'sqrt': 'sqrt', 'tan': 'tan', 'tanh': 'tanh', 
+'trunc': 'trunc'}
+
+_numpy_functions = {}
 
 ### Main functions
 
@@ -22,6 +33,189 @@ def math_eval(*args, **kwargs):
 	except (ValueError, ZeroDivisionError):
 		return 0
 
+def _log(x, base = None):
+	'''NumPy version of math.log, which takes an optional base'''
+	numpy = _numpy()
+	return numpy.log(x) if base is None else numpy.log(x) / numpy.log(base)
+
+def _elementwise(function):
+	'''Wraps a scalar 'math' function so that it can be vectorized over float arrays'''
+	def call(*args):
+		try:
+			try:
+				return function(*args)
+			except TypeError: # functions such as factorial only accept whole numbers
+				return function(*[int(arg) if float(arg).is_integer() else arg for arg in args])
+		except (ValueError, TypeError, ZeroDivisionError, OverflowError):
+			return float('nan')
+	return call
+
+def _infinite(value):
+	'''Whether 'value' is an infinite float (other values, such as strings, are not)'''
+	return isinstance(value, float) and math.isinf(value)
+
+def _finite_result(result, row):
+	'''Returns nan for a complex result, or an infinite result computed from finite values, matching the NumPy path of Function.evaluate_many'''
+	if isinstance(result, complex): return float('nan') # such as (-1)**0.5, which is nan in NumPy
+	if _infinite(float(result)) and not any(_infinite(value) for value in row.values()): return float('nan')
+	return result
+
+def _numpy_namespace():
+	'''Returns the namespace used to evaluate functions over NumPy arrays
+	Every name in 'math' is mapped to its NumPy ufunc; functions without one are vectorized'''
+	numpy = _numpy()
+	if not _numpy_functions:
+		for name, value in vars(math).items():
+			if name.startswith('_'): continue
+			if name in _ufuncs and hasattr(numpy, _ufuncs[name]):
+				value = getattr(numpy, _ufuncs[name])
+			elif callable(value):
+				value = numpy.vectorize(_elementwise(value), otypes = [float])
+			_numpy_functions[name] = value
+		_numpy_functions['log'] = _log
+		_numpy_functions['__builtins__'] = {}
+	return _numpy_functions
+
+### Symbolic differentiation
+# Expressions are built as (source, precedence) pairs so that only the necessary parentheses are written:
+# 0 = sum, 1 = product, 2 = unary minus, 3 = power, 4 = atom (number, name, or call)
+
+def _const(value):
+	'''Creates an expression from a number'''
+	if isinstance(value, float) and value.is_integer(): value = int(value)
+	return (repr(value), 2 if value < 0 else 4)
+
+def _value(expr):
+	'''Returns the number 'expr' represents, or None if it is not a number'''
+	if not expr[0].lstrip('-')[:1].isdigit(): return None # names such as 'inf' are not numbers here
+	try:
+		return float(expr[0])
+	except ValueError:
+		return None
+
+def _literal(expr):
+	'''Returns the int or float written by _const'''
+	try:
+		return int(expr[0])
+	except ValueError:
+		return float(expr[0])
+
+def _wrap(expr, precedence):
+	'''Returns the source of 'expr', parenthesized if it binds looser than 'precedence' '''
+	return expr[0] if expr[1] >= precedence else '(' + expr[0] + ')'
+
+def _add(a, b):
+	if _value(a) == 0: return b
+	if _value(b) == 0: return a
+	if _value(a) is not None and _value(b) is not None: return _const(_literal(a) + _literal(b))
+	return (a[0] + ' + ' + b[0], 0)
+
+def _sub(a, b):
+	if _value(b) == 0: return a
+	if _value(a) == 0: return _neg(b)
+	if _value(a) is not None and _value(b) is not None: return _const(_literal(a) - _literal(b))
+	return (a[0] + ' - ' + _wrap(b, 1), 0)
+
+def _mul(a, b):
+	if _value(a) == 0 or _value(b) == 0: return ('0', 4)
+	if _value(a) == 1: return b
+	if _value(b) == 1: return a
+	if _value(a) is not None and _value(b) is not None: return _const(_literal(a) * _literal(b))
+	if _value(a) == -1: return _neg(b)
+	if _value(b) == -1: return _neg(a)
+	return (_wrap(a, 1) + '*' + _wrap(b, 2), 1)
+
+def _div(a, b):
+	if _value(a) == 0: return ('0', 4)
+	if _value(b) == 1: return a
+	return (_wrap(a, 1) + '/' + _wrap(b, 2), 1)
+
+def _pow(a, b):
+	if _value(b) == 0: return ('1', 4)
+	if _value(b) == 1: return a
+	return (_wrap(a, 4) + '**' + _wrap(b, 2), 3)
+
+def _neg(a):
+	if _value(a) is not None: return _const(-_literal(a))
+	return ('-' + _wrap(a, 3), 2)
+
+def _call(name, *args):
+	return (name + '(' + ', '.join(arg[0] for arg in args) + ')', 4)
+
+# derivatives of the single-argument 'math' functions with respect to their argument
+_derivatives = {
+'sin': lambda u: _call('cos', u), 'cos': lambda u: _neg(_call('sin', u)), 'tan': lambda u: _div(('1', 4), _pow(_call('cos', u), ('2', 4))),
+'asin': lambda u: _div(('1', 4), _call('sqrt', _sub(('1', 4), _pow(u, ('2', 4))))),
+'acos': lambda u: _neg(_div(('1', 4), _call('sqrt', _sub(('1', 4), _pow(u, ('2', 4)))))),
+'atan': lambda u: _div(('1', 4), _add(('1', 4), _pow(u, ('2', 4)))),
+'sinh': lambda u: _call('cosh', u), 'cosh': lambda u: _call('sinh', u), 'tanh': lambda u: _div(('1', 4), _pow(_call('cosh', u), ('2', 4))),
+'exp': lambda u: _call('exp', u), 'expm1': lambda u: _call('exp', u), 'sqrt': lambda u: _div(('1', 4), _mul(('2', 4), _call('sqrt', u))),
+'log': lambda u: _div(('1', 4), u), 'log10': lambda u: _div(('1', 4), _mul(u, _call('log', ('10', 4)))),
+'log2': lambda u: _div(('1', 4), _mul(u, _call('log', ('2', 4)))), 'log1p': lambda u: _div(('1', 4), _add(('1', 4), u)),
+'fabs': lambda u: _call('copysign', ('1', 4), u)
+}
+
+def _number(node):
+	'''Returns the value of a numeric literal node, or None'''
+	import ast
+	if isinstance(node, getattr(ast, 'Constant', ())) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+		return node.value
+	if isinstance(node, getattr(ast, 'Num', ())): # Python 2 and Python < 3.8
+		return node.n
+	return None
+
+def _depends(node, var):
+	'''Checks whether the expression tree 'node' uses the variable 'var' '''
+	import ast
+	return any(isinstance(child, ast.Name) and child.id == var for child in ast.walk(node))
+
+def _source(node):
+	'''Rebuilds the expression of an expression tree'''
+	import ast
+	if _number(node) is not None: return _const(_number(node))
+	if isinstance(node, ast.Name): return (node.id, 4)
+	if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+		return _neg(_source(node.operand)) if isinstance(node.op, ast.USub) else _source(node.operand)
+	if isinstance(node, ast.BinOp):
+		combine = {ast.Add: _add, ast.Sub: _sub, ast.Mult: _mul, ast.Div: _div, ast.Pow: _pow}.get(type(node.op))
+		if combine is not None: return combine(_source(node.left), _source(node.right))
+	if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+		return _call(node.func.id, *[_source(arg) for arg in node.args])
+	raise ValueError("unsupported expression: " + ast.dump(node))
+
+def _derive(node, var):
+	'''Differentiates the expression tree 'node' with respect to 'var', returning an expression'''
+	import ast
+	if not _depends(node, var): return ('0', 4)
+	if isinstance(node, ast.Name): return ('1', 4)
+	if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+		return _neg(_derive(node.operand, var)) if isinstance(node.op, ast.USub) else _derive(node.operand, var)
+	if isinstance(node, ast.BinOp):
+		u, v, du, dv = _source(node.left), _source(node.right), _derive(node.left, var), _derive(node.right, var)
+		if isinstance(node.op, ast.Add): return _add(du, dv)
+		if isinstance(node.op, ast.Sub): return _sub(du, dv)
+		if isinstance(node.op, ast.Mult): return _add(_mul(du, v), _mul(u, dv))
+		if isinstance(node.op, ast.Div):
+			if not _depends(node.right, var): return _div(du, v)
+			return _div(_sub(_mul(du, v), _mul(u, dv)), _pow(v, ('2', 4)))
+		if isinstance(node.op, ast.Pow):
+			if not _depends(node.right, var): # power rule
+				n = _number(node.right)
+				lowered = _const(n - 1) if n is not None else _sub(v, ('1', 4))
+				return _mul(_mul(v, _pow(u, lowered)), du)
+			if not _depends(node.left, var): # exponential rule
+				return _mul(_mul(_pow(u, v), _call('log', u)), dv)
+			return _mul(_pow(u, v), _add(_mul(dv, _call('log', u)), _div(_mul(v, du), u)))
+	if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+		name, args = node.func.id, node.args
+		if name == 'pow' and len(args) == 2:
+			return _derive(ast.BinOp(left = args[0], op = ast.Pow(), right = args[1]), var)
+		if name == 'log' and len(args) == 2 and not _depends(args[1], var):
+			return _div(_derive(args[0], var), _mul(_source(args[0]), _call('log', _source(args[1]))))
+		if name in _derivatives and len(args) == 1:
+			return _mul(_derivatives[name](_source(args[0])), _derive(args[0], var))
+	raise ValueError("cannot differentiate: " + ast.dump(node))
+
 ### Main classes
 
 class Function(object):
@@ -29,9 +223,12 @@ class Function(object):
 	def __init__(self, function):
 		self.funct_str = False
 		self.variables = {}
+		self.code = self.expression = None
 		if isinstance(function, str):
 			self.funct_str = self.parse(function)
-			self.function = lambda **variables: eval(function, {"__builtins__": math}, variables)
+			self.expression = function
+			self.code = compile(function, '<nums.Function>', 'eval')
+			self.function = lambda **variables: eval(self.code, {"__builtins__": math}, variables)
 		elif isinstance(function, (types.FunctionType, types.LambdaType)):
 			self.function = function
 		else:
@@ -47,6 +244,7 @@ class Function(object):
 		
 	def parse(self, string):
 		'''Parses the string and returns a formatted function'''
+		import re
 		function = ''.join(string.split(' ')).replace('^', '**')
 		pattern = re.compile("([0-9]+|[a-z])(?=[a-z\(])", re.IGNORECASE)
 		pattern2 = re.compile("([\)])([0-9]+|[a-z])", re.IGNORECASE)
@@ -60,6 +258,7 @@ class Function(object):
 	
 	def detectVariables(self):
 		'''Tries to find any variables'''
+		import re
 		variable_pattern = re.compile('([a-z]+)(?!{})'.format('|'.join(math.__dict__.keys())))
 		variables = variable_pattern.findall(self.funct_str)
 		return variables
@@ -77,6 +276,7 @@ class Function(object):
 		'''Evaluates the function by plugging the variables'''
 		if "variable" in variables.keys():
 			def_value = variables["variable"]
+			import inspect
 			all_variables = self.detectVariables() if self.funct_str else inspect.getargspec(self.function)
 			for v in all_variables:
 				if v not in variables.keys(): 
@@ -86,4 +286,170 @@ class Function(object):
 			variables = self.variables.copy()
 		else:
 			self.variables = variables.copy()
-		return self.function(**variables)
\ No newline at end of file
+		return self.function(**variables)
+		
+	def evaluate_many(self, columns):
+		'''Evaluates the function over whole columns of values at once
+		'columns' maps variable names to sequences (or NumPy arrays) of the same length; single numbers are used for every row.
+		Returns a NumPy array if NumPy is installed, and an array('d') otherwise. Rows that cannot be evaluated are nan,
+		including infinite results from finite inputs (log(0), 1/0, overflow), so both backends give the same values.
+		Expressions that cannot be evaluated on whole arrays, such as conditional expressions, are evaluated row by row.
+		>>> f = Function('x**2 + y')
+		>>> f.evaluate_many({'x': [1, 2, 3], 'y': 1})
+		array([ 2.,  5., 10.])
+		>>> Function('log(x)').evaluate_many({'x': [0, 1]})
+		array([nan,  0.])'''
+		names, values, scalars, length = [], [], {}, None
+		for name, value in columns.items():
+			if isinstance(value, str) or not hasattr(value, '__len__'):
+				scalars[name] = value
+				continue
+			if length is None: length = len(value)
+			elif len(value) != length: raise ValueError("all columns must have the same length")
+			names.append(name)
+			values.append(value)
+		if length is None: length = 1
+		numpy = _numpy()
+		if numpy is not None and self.code is not None:
+			variables = dict((name, numpy.asarray(value, dtype = float)) for name, value in zip(names, values))
+			variables.update(scalars)
+			try:
+				with numpy.errstate(all = 'ignore'):
+					result = eval(self.code, _numpy_namespace(), variables)
+					result = numpy.array(numpy.broadcast_to(numpy.asarray(result, dtype = float), (length,)))
+			except (ValueError, TypeError): # the truth value of an array, in 'a if x > 0 else b', is ambiguous
+				return numpy.array(self._evaluate_rows(names, [variables[name].tolist() for name in names], scalars, length))
+			finite = numpy.ones(length, dtype = bool) & all(not _infinite(value) for value in scalars.values())
+			for name in names:
+				finite &= numpy.isfinite(variables[name])
+			result[finite & numpy.isinf(result)] = float('nan') # the pure-Python path raises for these
+			return result
+		return self._evaluate_rows(names, values, scalars, length)
+
+	def _evaluate_rows(self, names, values, scalars, length):
+		'''Evaluates the function one row at a time for evaluate_many, returning an array('d')'''
+		results, row = array('d'), scalars.copy()
+		rows = zip(*values) if values else [()] * length
+		if self.code is not None:
+			code, scope = self.code, {"__builtins__": math}
+			for items in rows:
+				row.update(zip(names, items))
+				try:
+					results.append(_finite_result(eval(code, scope, row), row))
+				except (ValueError, ZeroDivisionError, OverflowError):
+					results.append(float('nan'))
+		else:
+			function = self.function
+			for items in rows:
+				row.update(zip(names, items))
+				try:
+					results.append(_finite_result(function(**row), row))
+				except (ValueError, ZeroDivisionError, OverflowError):
+					results.append(float('nan'))
+		return results
+		
+	def derivative(self, var = 'x'):
+		'''Returns the derivative of the function with respect to 'var' as another Function
+		Any other variables are treated as constants.
+		>>> Function('x**3 + sin(2*x)').derivative('x').expression
+		'3*x**2 + cos(2*x)*2'
+		'''
+		import ast
+		if self.expression is None: raise TypeError("only string functions can be differentiated")
+		derivative = Function(_derive(ast.parse(self.expression.strip(), mode = 'eval').body, var)[0])
+		derivative.variables = self.variables.copy()
+		return derivative
+		
+	def roots(self, var = 'x', interval = (0, 1), divisions = None, tolerance = 1e-12, max_iterations = 100):
+		'''Returns the roots of the function with respect to 'var' inside 'interval'
+		The interval is split into 'divisions' brackets; each one whose ends differ in sign is solved with Halley's method,
+		falling back to bisection whenever a step would leave the bracket. Other variables keep their current values.
+		By default there are max(16, 4 * width) brackets (at most 4096). Roots closer together than a bracket, or where the function
+		touches zero without changing sign, can still be missed, so the search is only exhaustive for well-separated sign changes.
+		Sign changes across a pole, such as tan(x) at pi/2, are not roots and are left out. Linear and quadratic functions are solved in closed form.
+		>>> Function('x**2 - 2').roots('x', (0, 2))
+		[1.414213562373095]
+		>>> len(Function('cos(x)').roots('x', (0, 10)))
+		3'''
+		lo, hi = float(min(interval)), float(max(interval))
+		if divisions is None: divisions = min(4096, max(16, int(math.ceil(4 * (hi - lo)))))
+		if divisions < 1: raise ValueError("divisions must be at least 1")
+		f, df, d2f = self, None, None
+		if self.expression is not None:
+			try:
+				df = self.derivative(var)
+				d2f = df.derivative(var)
+				if d2f.derivative(var).expression.strip() == '0':
+					return self._quadratic_roots(var, df, d2f, lo, hi)
+			except ValueError:
+				df = d2f = None
+		f, df, d2f = [self._curve(var, g) for g in (f, df, d2f)]
+		points = [lo + (hi - lo) * i / divisions for i in range(divisions + 1)]
+		values = [f(x) for x in points]
+		roots = []
+		for i in range(divisions):
+			a, b, fa, fb = points[i], points[i + 1], values[i], values[i + 1]
+			if fa == 0: 
+				roots.append(a)
+			elif fa * fb < 0: 
+				root = _bracketed_root(f, df, d2f, a, b, fa, tolerance, max_iterations)
+				if abs(f(root)) <= math.sqrt(tolerance) * (1 + max(abs(fa), abs(fb))): # across a pole, f grows instead of vanishing
+					roots.append(root)
+		if values[-1] == 0: roots.append(points[-1])
+		return roots
+		
+	def _curve(self, var, function):
+		'''Returns a one-argument callable evaluating 'function' (a Function or None) at var = x; errors give nan'''
+		if function is None: return None
+		variables = self.variables.copy()
+		if function.code is not None:
+			code, scope = function.code, {"__builtins__": math}
+			def curve(x):
+				variables[var] = x
+				try:
+					return eval(code, scope, variables)
+				except (ValueError, ZeroDivisionError, OverflowError):
+					return float('nan')
+		else:
+			call = function.function
+			def curve(x):
+				variables[var] = x
+				try:
+					return call(**variables)
+				except (ValueError, ZeroDivisionError, OverflowError):
+					return float('nan')
+		return curve
+		
+	def _quadratic_roots(self, var, df, d2f, lo, hi):
+		'''Closed-form roots of a function whose third derivative is zero'''
+		c, b, a = [self._curve(var, g)(0.0) for g in (self, df, d2f)]
+		a /= 2
+		if a == 0:
+			roots = [-c / b] if b != 0 else []
+		else:
+			discriminant = b * b - 4 * a * c
+			if discriminant < 0: return []
+			q = -0.5 * (b + math.copysign(discriminant ** 0.5, b))
+			roots = [q / a, c / q] if q != 0 else [0.0]
+		return sorted(set(x for x in roots if lo <= x <= hi))
+
+def _bracketed_root(f, df, d2f, a, b, fa, tolerance, max_iterations):
+	'''Finds the root of 'f' in [a, b], where f(a) = fa and f(b) have opposite signs
+	Uses Halley's method (or Newton's without a second derivative), bisecting when a step leaves the bracket'''
+	x = (a + b) / 2.0
+	for iteration in range(max_iterations):
+		fx = f(x)
+		if fx == 0: return x
+		if (fx < 0) == (fa < 0): a, fa = x, fx
+		else: b = x
+		step = None
+		if df is not None:
+			dfx = df(x)
+			denominator = dfx
+			if d2f is not None: denominator = dfx - fx * d2f(x) / (2 * dfx) if dfx else 0
+			if denominator and denominator == denominator: step = fx / denominator
+		new = x - step if step is not None else None
+		if new is None or not (a < new < b): new = (a + b) / 2.0
+		if abs(new - x) <= tolerance * (1 + abs(x)) or b - a <= tolerance * (1 + abs(x)): return new
+		x = new
+	return x
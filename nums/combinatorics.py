@@ -0,0 +1,234 @@
+# nums.combinatorics.py
+# written by Rushy Panchal
+# Version 1.0
+
+'''Provides combinatorial functions
+
+'nums.combinatorics.py' contains factorials, binomial coefficients and multinomial coefficients, both exact and modulo an integer.
+
+OVERVIEW:
+	'nums.combinatorics.py' is a module in the 'nums' package that computes large factorials and binomial coefficients from their prime factorizations.
+	The primes come from the sieve in 'nums.sequences', the exponent of each prime comes from Legendre's formula (or Kummer's theorem for binomials),
+	and the prime powers are multiplied together with a balanced product tree, so that most multiplications are between numbers of similar size.
+	The modular variants use Lucas' theorem for prime moduli, Granville's generalization for prime powers, and the Chinese Remainder Theorem to combine them.
+	Example of the module's capabilities (run nums.combinatorics.example() to see this example):
+
+	-------------------------------------------------------
+	from nums.combinatorics import *
+	print('20! = ', factorial(20))
+	print('C(100, 50) = ', binomial(100, 50))
+	print('Multinomial(3, 4, 5) = ', multinomial(3, 4, 5))
+	print('C(10**18, 10**9) mod 1000000 = ', binomial_mod(10**18, 10**9, 1000000))
+	-------------------------------------------------------
+'''
+
+### Change Log:
+
+	# v1.0: Initial release
+
+from nums.errors import *
+from nums.errors import _integer
+from nums.sequences import sieve
+from nums.figurate import _isqrt
+
+### Internal functions
+
+def _natural(n):
+	"""Returns 'n' as an int, raising a NumericalError if it is not a non-negative whole number"""
+	n = _integer(n)
+	if n < 0: raise NumericalError(value_("must not be negative"))
+	return n
+
+def _product(values, start = 0, stop = None):
+	"""Multiplies values[start:stop] with a balanced product tree"""
+	if stop is None: stop = len(values)
+	if stop - start <= 8:
+		result = 1
+		for i in range(start, stop):
+			result *= values[i]
+		return result
+	middle = (start + stop) // 2
+	return _product(values, start, middle) * _product(values, middle, stop)
+
+def _legendre(n, p):
+	"""Returns the exponent of the prime 'p' in n!, by Legendre's formula"""
+	exponent = 0
+	while n:
+		n //= p
+		exponent += n
+	return exponent
+
+def _from_exponents(primes, exponent):
+	"""Returns the product of p**exponent(p) over 'primes'
+	Primes are grouped by the bits of their exponents, so that the result is built by repeated squaring:
+	prod p**e == (...((P_t)**2 * P_(t-1))**2 ...)**2 * P_0, where P_i is the product of the primes whose exponent has bit i set"""
+	exponents = [(p, exponent(p)) for p in primes]
+	exponents = [(p, e) for p, e in exponents if e]
+	if not exponents: return 1
+	result = 1
+	for bit in reversed(range(max(e for p, e in exponents).bit_length())):
+		result = result * result * _product([p for p, e in exponents if e >> bit & 1])
+	return result
+
+def _swing(n, primes):
+	"""Returns the swinging factorial n! / (n//2)!**2, from the exponents of its prime factors"""
+	root = _isqrt(n)
+	factors = []
+	for p in primes:
+		if p > n: break
+		if p <= root:
+			q, power = n, 1
+			while q >= p:
+				q //= p
+				if q & 1: power *= p
+			if power > 1: factors.append(power)
+		elif (n // p) & 1: factors.append(p) # p appears at most once
+	return _product(factors)
+
+def _factorial(n, primes):
+	"""Returns n! as the product of (n//2)!**2 and the swinging factorial of 'n' (Luschny's prime-swing algorithm)"""
+	if n < 2: return 1
+	half = _factorial(n // 2, primes)
+	return half * half * _swing(n, primes)
+
+def _factorize(m):
+	"""Returns the prime factorization of 'm' as a list of (prime, exponent) pairs, by trial division"""
+	factors, p = [], 2
+	while p * p <= m:
+		if m % p == 0:
+			exponent = 0
+			while m % p == 0:
+				m //= p
+				exponent += 1
+			factors.append((p, exponent))
+		p += 1 if p == 2 else 2
+	if m > 1: factors.append((m, 1))
+	return factors
+
+def _binomial_small(n, k, p):
+	"""Returns C(n, k) mod the prime 'p', for n < p"""
+	if k < 0 or k > n: return 0
+	k = min(k, n - k)
+	numerator = denominator = 1
+	for i in range(k):
+		numerator = numerator * (n - i) % p
+		denominator = denominator * (i + 1) % p
+	return numerator * pow(denominator, p - 2, p) % p
+
+def _lucas(n, k, p):
+	"""Returns C(n, k) mod the prime 'p', by Lucas' theorem: the product of the binomials of the base-p digits of 'n' and 'k'"""
+	result = 1
+	while k and result:
+		result = result * _binomial_small(n % p, k % p, p) % p
+		n, k = n // p, k // p
+	return result
+
+def _granville(n, k, p, q):
+	"""Returns C(n, k) mod p**q, by Granville's generalization of Lucas' theorem
+	C(n, k) is p**e times a product of factorials with their multiples of 'p' removed (n!_p), which are periodic mod p**q"""
+	modulus = p ** q
+	e = _legendre(n, p) - _legendre(k, p) - _legendre(n - k, p)
+	if e >= q: return 0
+	table = [1] * modulus # table[i] is the product of the numbers up to i that are not divisible by p, mod p**q
+	for i in range(1, modulus):
+		table[i] = table[i - 1] * (i if i % p else 1) % modulus
+	def reduced(m):
+		"""Returns m! with all factors of 'p' removed, mod p**q"""
+		result = 1
+		while m:
+			result = result * pow(table[-1], m // modulus, modulus) * table[m % modulus] % modulus
+			m //= p
+		return result
+	denominator = reduced(k) * reduced(n - k) % modulus
+	return reduced(n) * _inverse(denominator, modulus) * p ** e % modulus
+
+def _inverse(a, m):
+	"""Returns the inverse of 'a' modulo 'm', with the extended Euclidean algorithm"""
+	x, y, r, s = 1, 0, a % m, m
+	while s:
+		quotient = r // s
+		x, y, r, s = y, x - quotient * y, s, r - quotient * s
+	return x % m
+
+### Main functions
+
+def factorial(n):
+	"""Returns n! exactly, with the prime-swing algorithm
+	>>> factorial(20)
+	2432902008176640000"""
+	n = _natural(n)
+	if n < 2: return 1
+	return _factorial(n, sieve(n))
+
+def binomial(n, k):
+	"""Returns the binomial coefficient C(n, k), the number of ways to choose 'k' items out of 'n'
+	Computed from its prime factorization: by Kummer's theorem, the exponent of p is the number of borrows when subtracting 'k' from 'n' in base p
+	>>> binomial(100, 50)
+	100891344545564193334812497256
+	>>> binomial(5, 7)
+	0"""
+	n, k = _natural(n), _natural(k)
+	if k > n: return 0
+	k = min(k, n - k)
+	if k < 8: # a few multiplications beat sieving
+		result = 1
+		for i in range(k):
+			result = result * (n - i) // (i + 1)
+		return result
+	def exponent(p):
+		if p > n - k: return 1 # p divides the numerator n!/(n - k)! exactly once
+		if p * p > n: return 1 if n % p < k % p else 0 # a single digit can borrow at most once
+		borrows, carry, a, b = 0, 0, n, k
+		while a:
+			carry = 1 if a % p < b % p + carry else 0
+			borrows += carry
+			a, b = a // p, b // p
+		return borrows
+	return _from_exponents(sieve(n), exponent)
+
+def multinomial(*counts):
+	"""Returns the multinomial coefficient (k1 + k2 + ...)! / (k1! * k2! * ...)
+	The counts can also be given as a single iterable. The exponent of each prime comes from Legendre's formula
+	>>> multinomial(3, 4, 5)
+	27720
+	>>> multinomial([2, 2])
+	6"""
+	if len(counts) == 1 and hasattr(counts[0], '__iter__'): counts = tuple(counts[0])
+	counts = [_natural(k) for k in counts]
+	n = sum(counts)
+	counts = [k for k in counts if k]
+	if len(counts) < 2: return 1
+	if len(counts) == 2: return binomial(n, counts[0])
+	return _from_exponents(sieve(n), lambda p: _legendre(n, p) - sum(_legendre(k, p) for k in counts))
+
+def binomial_mod(n, k, m):
+	"""Returns C(n, k) mod 'm', without computing C(n, k)
+	Uses Lucas' theorem for prime factors of 'm', Granville's theorem for prime power factors, and the Chinese Remainder Theorem to combine them.
+	The cost depends on the prime powers dividing 'm' rather than on 'n', so 'n' can be very large
+	>>> binomial_mod(10, 3, 7)
+	1
+	>>> binomial_mod(10**18, 10**9, 1000000)
+	0"""
+	n, k, m = _natural(n), _natural(k), _natural(m)
+	if m == 0: raise NumericalError(value_(getError('nonzero')))
+	if m == 1 or k > n: return 0
+	result, modulus = 0, 1
+	for p, q in _factorize(m):
+		remainder = _lucas(n, k, p) if q == 1 else _granville(n, k, p, q)
+		factor = p ** q
+		# Chinese Remainder Theorem: combine result (mod modulus) with remainder (mod factor)
+		result += modulus * ((remainder - result) * _inverse(modulus, factor) % factor)
+		modulus *= factor
+	return result % m
+
+### Example to show the module's capabilities
+
+def example():
+	"""Example of the module's capabilities"""
+	print('20! = ', factorial(20))
+	print('C(100, 50) = ', binomial(100, 50))
+	print('Multinomial(3, 4, 5) = ', multinomial(3, 4, 5))
+	print('C(10**18, 10**9) mod 1000000 = ', binomial_mod(10**18, 10**9, 1000000))
+
+if __name__ == '__main__':
+	help('nums.combinatorics')
@@ -23,6 +23,8 @@ try:
 except NameError: 
 	types = (float, int) # handle Python 3.x, because 'long' was removed
 	raw_input = input # also handles input in Python 3.3
+	xrange = range # range is lazy in Python 3.x
+	StringType = str # 'types' no longer has the Python 2.x type aliases
 	
 class NumericalError(Exception):
 	'''Custom class for Numerical Errors'''
@@ -50,4 +52,74 @@ _errorTypes = {
 'nonzero': 'cannot be zero', 'greaterthanzero': 'must be greater than zero', 'lessthanzero': 'must be less than zero'
 }
 
-getError = lambda error, default = '': _errorTypes.get(error, default)
\ No newline at end of file
+getError = lambda error, default = '': _errorTypes.get(error, default)
+
+### Argument validation
+# The public functions check their arguments before calling their unchecked kernels (the functions with the same name and a leading underscore).
+# Callers that already know their arguments are valid, such as tight loops, can skip the checks with trusted() or setTrusted(True).
+
+try:
+	import contextvars # Python 3.7+
+except ImportError:
+	contextvars = None
+
+if contextvars is not None:
+	_trust = contextvars.ContextVar('nums_trusted', default = False)
+	
+	class _Validation(object):
+		'''Holds whether the public functions validate their arguments; shared by every module in 'nums'
+		The setting belongs to the current context, so trusting in one thread or asyncio task does not affect the others'''
+		__slots__ = ()
+		enabled = property(lambda self: not _trust.get())
+else:
+	import threading
+	
+	class _Validation(threading.local):
+		'''Holds whether the public functions validate their arguments; shared by every module in 'nums'
+		The setting belongs to the current thread, so trusting in one thread does not affect the others'''
+		enabled = True
+
+_validation = _Validation()
+
+def setTrusted(trust = True):
+	'''Turns argument validation off (trust = True) or back on (trust = False) in the current thread or asyncio task; returns the previous setting
+	New threads, including the executor pools of 'nums.aio', start with validation on'''
+	previous = not _validation.enabled
+	if contextvars is not None: _trust.set(bool(trust))
+	else: _validation.enabled = not trust
+	return previous
+
+class trusted(object):
+	'''Context manager that turns argument validation off inside its block, for the current thread or asyncio task only:
+	>>> with trusted():
+	...     pFactors(600851475143)
+	[71, 839, 1471, 6857]
+	Invalid arguments are not caught inside the block, so they may raise other exceptions or return wrong results.'''
+	def __enter__(self):
+		if contextvars is not None: self.token = _trust.set(True) # reset() restores this context's value even if blocks interleave
+		else: self.previous = setTrusted(True)
+		return self
+		
+	def __exit__(self, *exc_info):
+		if contextvars is not None: _trust.reset(self.token)
+		else: setTrusted(self.previous)
+		return False
+
+def _integer(n):
+	'''Returns 'n' as an int, raising a NumericalError if it is not a whole number (infinities and nan are not)'''
+	if isinstance(n, float) and not n.is_integer(): raise NumericalError(type_(getError('int')))
+	if not isinstance(n, types) or n != int(n): raise NumericalError(type_(getError('int')))
+	return int(n)
+
+_optional = {}
+
+def _numpy():
+	'''Returns the numpy module, importing it on first use, or None if NumPy is not installed
+	NumPy is optional and takes longer to import than all of 'nums', so it is only loaded once an array is needed'''
+	if 'numpy' not in _optional:
+		try:
+			import numpy
+		except ImportError:
+			numpy = None
+		_optional['numpy'] = numpy
+	return _optional['numpy']
\ No newline at end of file
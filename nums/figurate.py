@@ -0,0 +1,225 @@
+# nums.figurate.py
+# written by Rushy Panchal
+# Version 1.0
+
+'''Provides figurate (polygonal) numbers
+
+'nums.figurate.py' contains functions for the triangular, square, pentagonal, hexagonal and general k-gonal numbers.
+
+OVERVIEW:
+	'nums.figurate.py' is a module in the 'nums' package that computes the nth k-gonal number exactly, tests membership in constant time
+	(with an integer square root instead of a search), and counts or generates the k-gonal numbers in a range without visiting the numbers in between.
+	The membership tests also accept arrays, which are tested all at once with NumPy (or one by one without it).
+	Example of the module's capabilities (run nums.figurate.example() to see this example):
+
+	-------------------------------------------------------
+	from nums.figurate import *
+	print('10th pentagonal number: ', pentagonal(10))
+	print('is_triangular(5050) --> ', is_triangular(5050))
+	print('Hexagonal numbers up to 100: ', list(polygonal_range(6, 1, 100)))
+	print('Number of square numbers up to 10**12: ', polygonal_count(4, 1, 10**12))
+	-------------------------------------------------------
+'''
+
+### Change Log:
+
+	# v1.0: Initial release
+
+from nums.errors import *
+from nums.errors import _numpy, _integer
+import math
+
+try:
+	_isqrt = math.isqrt
+except AttributeError:
+	def _isqrt(n):
+		"""Returns the integer square root of 'n' (the largest x such that x*x <= n), for versions without math.isqrt"""
+		if n < 0: raise ValueError("isqrt() argument must be nonnegative")
+		if n == 0: return 0
+		x = 1 << ((n.bit_length() + 1) // 2)
+		while True:
+			y = (x + n // x) // 2
+			if y >= x: return x
+			x = y
+
+### Internal functions
+
+def _sides(k):
+	"""Validates the number of sides of a polygon"""
+	k = _integer(k)
+	if k < 3: raise NumericalError(value_("a polygon must have at least 3 sides"))
+	return k
+
+def _whole(x):
+	"""Whether the number 'x' is a whole number (infinities and nan are not)"""
+	return isinstance(x, types) and (not isinstance(x, float) or x.is_integer())
+
+def _is_array(x):
+	"""Whether 'x' should be treated as an array of values"""
+	return not isinstance(x, str) and hasattr(x, '__iter__')
+
+def _index(k, x):
+	"""Returns the largest n >= 0 such that polygonal(k, n) <= x, for an integer x
+	Solves (k - 2)*n**2 - (k - 4)*n - 2*x = 0 for n with an integer square root"""
+	if x < 0: return -1
+	root = _isqrt(8 * (k - 2) * x + (k - 4) ** 2)
+	return (root + k - 4) // (2 * (k - 2))
+
+def _is_polygonal(k, x):
+	"""Tests a single integer for membership, in constant time"""
+	if x < 0: return False
+	discriminant = 8 * (k - 2) * x + (k - 4) ** 2
+	root = _isqrt(discriminant)
+	return x == 0 or root * root == discriminant and (root + k - 4) % (2 * (k - 2)) == 0 # 0 is the root n = 0 of the other sign
+
+def _is_polygonal_array(k, values):
+	"""Tests an array of integers for membership at once, returning a boolean NumPy array
+	The discriminants are computed in int64 when they cannot overflow, and otherwise element by element"""
+	numpy = _numpy()
+	values = numpy.asarray(values)
+	with numpy.errstate(invalid = 'ignore'): # nan and infinities are compared and replaced, not used
+		return _is_polygonal_values(numpy, k, values)
+
+def _is_polygonal_values(numpy, k, values):
+	"""Body of _is_polygonal_array for a NumPy array 'values'"""
+	if values.dtype.kind == 'f':
+		whole = numpy.isfinite(values) & (values == numpy.floor(values))
+		values = numpy.where(whole, values, -1)
+	else:
+		whole = True
+	if values.size and values.dtype.kind in 'iuf' and numpy.abs(values).max() < (2 ** 62 - (k - 4) ** 2) // (8 * (k - 2)):
+		values = values.astype(numpy.int64)
+		discriminant = 8 * (k - 2) * values + (k - 4) ** 2
+		root = numpy.sqrt(numpy.maximum(discriminant, 0).astype(numpy.float64)).astype(numpy.int64) # negative values are rejected below
+		root -= root * root > discriminant # the float square root can be off by one either way
+		root += (root + 1) * (root + 1) <= discriminant
+		return whole & ((values == 0) | (values > 0) & (root * root == discriminant) & ((root + k - 4) % (2 * (k - 2)) == 0))
+	flat = [_whole(x) and _is_polygonal(k, int(x)) for x in values.ravel().tolist()]
+	return whole & numpy.array(flat, dtype = bool).reshape(values.shape)
+
+### Main functions
+
+def polygonal(k, n):
+	"""Returns the 'n'th 'k'-gonal number, ((k - 2)*n**2 - (k - 4)*n) / 2, as an exact int
+	'n' can also be a NumPy array of integers
+	>>> polygonal(3, 25)
+	325
+	>>> polygonal(5, 10)
+	145"""
+	k = _sides(k)
+	if not isinstance(n, types):
+		numpy = _numpy()
+		if numpy is None or not isinstance(n, numpy.ndarray) or n.dtype.kind not in 'iu': raise NumericalError(type_(getError('int')))
+		return ((k - 2) * n * n - (k - 4) * n) // 2
+	n = _integer(n)
+	return ((k - 2) * n * n - (k - 4) * n) // 2
+
+def triangular(n):
+	"""Returns the 'n'th triangular number
+	>>> triangular(100)
+	5050"""
+	return polygonal(3, n)
+
+def square(n):
+	"""Returns the 'n'th square number
+	>>> square(12)
+	144"""
+	return polygonal(4, n)
+
+def pentagonal(n):
+	"""Returns the 'n'th pentagonal number
+	>>> pentagonal(4)
+	22"""
+	return polygonal(5, n)
+
+def hexagonal(n):
+	"""Returns the 'n'th hexagonal number
+	>>> hexagonal(4)
+	28"""
+	return polygonal(6, n)
+
+def is_polygonal(k, x):
+	"""Returns whether 'x' is a 'k'-gonal number (including 0), in constant time
+	'x' can also be an array or iterable, which returns a boolean NumPy array (or a list without NumPy),
+	so filtering large arrays is a single vectorized operation: values[is_polygonal(k, values)]
+	>>> is_polygonal(5, 145)
+	True
+	>>> is_polygonal(5, 146)
+	False"""
+	k = _sides(k)
+	if _is_array(x):
+		if _numpy() is not None: return _is_polygonal_array(k, x)
+		return [_whole(value) and _is_polygonal(k, int(value)) for value in x]
+	if not isinstance(x, types): raise NumericalError(type_(getError('num')))
+	return _whole(x) and _is_polygonal(k, int(x))
+
+def is_triangular(x):
+	"""Returns whether 'x' is a triangular number
+	>>> is_triangular(5050)
+	True"""
+	return is_polygonal(3, x)
+
+def is_square(x):
+	"""Returns whether 'x' is a perfect square
+	>>> is_square(10**20)
+	True"""
+	return is_polygonal(4, x)
+
+def is_pentagonal(x):
+	"""Returns whether 'x' is a pentagonal number
+	>>> is_pentagonal(22)
+	True"""
+	return is_polygonal(5, x)
+
+def is_hexagonal(x):
+	"""Returns whether 'x' is a hexagonal number
+	>>> is_hexagonal(28)
+	True"""
+	return is_polygonal(6, x)
+
+def polygonal_index(k, x):
+	"""Returns the number of positive 'k'-gonal numbers that are at most 'x'
+	This is also the index n of the largest 'k'-gonal number <= 'x', so it inverts polygonal(): polygonal_index(k, polygonal(k, n)) == n
+	>>> polygonal_index(3, 5050)
+	100
+	>>> polygonal_index(3, 5049)
+	99"""
+	k = _sides(k)
+	if not isinstance(x, types): raise NumericalError(type_(getError('num')))
+	return max(0, _index(k, int(math.floor(x))))
+
+def polygonal_count(k, a, b):
+	"""Returns the number of positive 'k'-gonal numbers from 'a' to 'b' (inclusive), without generating them
+	>>> polygonal_count(4, 1, 10**12)
+	1000000"""
+	k = _sides(k)
+	a, b = _integer(a), _integer(b)
+	if b < a: return 0
+	return max(0, _index(k, b)) - max(0, _index(k, a - 1))
+
+def polygonal_range(k, a, b = None):
+	"""Lazily generates the positive 'k'-gonal numbers from 'a' to 'b' (inclusive), or up to 'a' if 'b' is not given
+	Starts directly at the first index in range, so only the numbers that are yielded are computed
+	>>> list(polygonal_range(6, 1, 100))
+	[1, 6, 15, 28, 45, 66, 91]"""
+	if b is None: a, b = 1, a
+	k = _sides(k)
+	a, b = _integer(a), _integer(b)
+	n = max(0, _index(k, a - 1)) + 1
+	step, value = k - 2, polygonal(k, n)
+	while value <= b:
+		yield value
+		value += step * n + 1 # polygonal(k, n + 1) - polygonal(k, n)
+		n += 1
+
+### Example to show the module's capabilities
+
+def example():
+	"""Example of the module's capabilities"""
+	print('10th pentagonal number: ', pentagonal(10))
+	print('is_triangular(5050) --> ', is_triangular(5050))
+	print('Hexagonal numbers up to 100: ', list(polygonal_range(6, 1, 100)))
+	print('Number of square numbers up to 10**12: ', polygonal_count(4, 1, 10**12))
+
+if __name__ == '__main__':
+	help('nums.figurate')
@@ -0,0 +1,258 @@
+# nums.instrument.py
+# written by Rushy Panchal
+# Version 1.0
+
+'''Provides opt-in instrumentation of the 'nums' functions
+
+'nums.instrument.py' records how often the public functions of 'nums' are called, how long they take, how large their inputs are, and who calls them.
+
+OVERVIEW:
+	'nums.instrument.py' is a module in the 'nums' package that wraps the public functions of 'nums.sequences', 'nums.number_theory' and 'nums.Fraction'
+	(and their unchecked kernels, such as _isPrime) with counters and timers. Instrumentation is off unless it is turned on, either with enable()
+	or by setting the environment variable NUMS_INSTRUMENT=1 before 'nums' is imported. While it is off, the original functions are in place,
+	so there is no overhead at all.
+	For every function it records the number of calls, the total, minimum and maximum time, a histogram of latencies in power-of-two buckets
+	of nanoseconds (from which the percentiles are estimated), a histogram of input sizes (the bit length of an int, or the length of a sequence,
+	also in power-of-two buckets), and which instrumented function made each call, so that isPrime called from n_primes is told apart from direct calls.
+	Generators are only timed while they are created, not while they are consumed.
+	Example of the module's capabilities (run nums.instrument.example() to see this example):
+
+	-------------------------------------------------------
+	from nums import instrument
+	from nums.sequences import n_primes
+	with instrument.report() as report:
+		n_primes(500)
+	print(report.text())
+	-------------------------------------------------------
+'''
+
+### Change Log:
+
+	# v1.0: Initial release
+
+import threading
+import functools
+import types
+import json
+import sys
+
+try:
+	from time import perf_counter as _clock # Python 3.3+
+except ImportError:
+	from time import time as _clock
+
+_default_modules = ('sequences', 'number_theory', 'Fraction')
+_operators = ('__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__', '__truediv__', '__rtruediv__') # instrumented like public methods
+
+### Statistics
+
+class _Stats(object):
+	'''Call statistics of a single function'''
+	__slots__ = ('calls', 'total', 'minimum', 'maximum', 'latencies', 'sizes', 'callers')
+
+	def __init__(self):
+		self.calls, self.total, self.minimum, self.maximum = 0, 0.0, None, 0.0
+		self.latencies, self.sizes, self.callers = {}, {}, {}
+
+	def record(self, elapsed, size, caller):
+		'''Adds one call that took 'elapsed' seconds'''
+		self.calls += 1
+		self.total += elapsed
+		if self.minimum is None or elapsed < self.minimum: self.minimum = elapsed
+		if elapsed > self.maximum: self.maximum = elapsed
+		bucket = int(elapsed * 1e9).bit_length() # the call took less than 2**bucket nanoseconds
+		self.latencies[bucket] = self.latencies.get(bucket, 0) + 1
+		if size is not None: self.sizes[size] = self.sizes.get(size, 0) + 1
+		self.callers[caller] = self.callers.get(caller, 0) + 1
+
+	def merge(self, other):
+		'''Adds the calls recorded in 'other' '''
+		self.calls += other.calls
+		self.total += other.total
+		if other.minimum is not None and (self.minimum is None or other.minimum < self.minimum): self.minimum = other.minimum
+		self.maximum = max(self.maximum, other.maximum)
+		for mine, theirs in ((self.latencies, other.latencies), (self.sizes, other.sizes), (self.callers, other.callers)):
+			for key, count in theirs.items():
+				mine[key] = mine.get(key, 0) + count
+
+	def percentile(self, fraction):
+		'''Estimates a latency percentile (in seconds) as the upper bound of the bucket that contains it'''
+		rank, seen = fraction * self.calls, 0
+		for bucket in sorted(self.latencies):
+			seen += self.latencies[bucket]
+			if seen >= rank: return min(2 ** bucket / 1e9, self.maximum)
+		return self.maximum
+
+	def summary(self):
+		'''Returns the statistics as a dict of plain values'''
+		return {'calls': self.calls, 'total': self.total, 'mean': self.total / self.calls if self.calls else 0.0,
+			'min': self.minimum or 0.0, 'max': self.maximum,
+			'p50': self.percentile(0.5), 'p90': self.percentile(0.9), 'p99': self.percentile(0.99),
+			'latency_histogram': dict((2 ** bucket, count) for bucket, count in sorted(self.latencies.items())),
+			'size_histogram': dict((2 ** bucket if bucket else 0, count) for bucket, count in sorted(self.sizes.items())),
+			'callers': dict((caller or '<direct>', count) for caller, count in self.callers.items())}
+
+_state = {'stats': {}, 'patched': []} # the statistics being recorded, and the (owner, name, original) of every patched attribute
+_lock = threading.Lock()
+_local = threading.local()
+
+def _size(args):
+	'''Returns the power-of-two bucket of the size of the first argument: the bit length of an int, or the length of a sequence'''
+	if not args: return None
+	value = args[0]
+	if isinstance(value, bool): return None
+	if isinstance(value, int) or type(value).__name__ == 'long': n = abs(value).bit_length()
+	elif hasattr(value, '__len__') and not isinstance(value, dict):
+		try:
+			n = len(value)
+		except TypeError:
+			return None
+	else:
+		return None
+	return n.bit_length() # the size is less than 2**bucket
+
+def _wrap(name, function):
+	'''Returns 'function' wrapped with a timer that records into the statistics of 'name' '''
+	@functools.wraps(function)
+	def wrapper(*args, **kwargs):
+		stack = getattr(_local, 'stack', None)
+		if stack is None: stack = _local.stack = []
+		caller = stack[-1] if stack else None
+		stack.append(name)
+		start = _clock()
+		try:
+			return function(*args, **kwargs)
+		finally:
+			elapsed = _clock() - start
+			stack.pop()
+			with _lock:
+				stats = _state['stats'].get(name)
+				if stats is None: stats = _state['stats'][name] = _Stats()
+				stats.record(elapsed, _size(args), caller)
+	wrapper._instrumented = function
+	return wrapper
+
+### Main functions
+
+def _targets(module):
+	'''Returns {original: qualified name} for the functions of 'module' to instrument:
+	its public functions, the unchecked kernels '_name' of those functions, and the public methods and arithmetic operators of its classes.
+	Functions that are already instrumented are left out, so enabling twice does not wrap them twice'''
+	targets, namespace = {}, vars(module)
+	for name, value in namespace.items():
+		if hasattr(value, '_instrumented'): continue
+		if isinstance(value, types.FunctionType) and value.__module__ == module.__name__ and name != 'example':
+			if not name.startswith('_') or (name[1:2] != '_' and isinstance(namespace.get(name[1:]), types.FunctionType)):
+				targets[value] = module.__name__ + '.' + name
+		elif isinstance(value, type) and value.__module__ == module.__name__:
+			for method, function in vars(value).items():
+				if isinstance(function, types.FunctionType) and not hasattr(function, '_instrumented') and (not method.startswith('_') or method in _operators):
+					if function not in targets or not method.startswith('__r'): # __radd__ = __add__ is recorded as __add__
+						targets[function] = module.__name__ + '.' + name + '.' + method
+	return targets
+
+def _owners():
+	'''Returns the loaded 'nums' modules and the classes defined in them, which are the namespaces where functions get bound'''
+	owners = [module for name, module in list(sys.modules.items()) if module is not None and (name == 'nums' or name.startswith('nums.'))]
+	return owners + [value for owner in owners for value in list(vars(owner).values())
+		if isinstance(value, type) and getattr(value, '__module__', '').startswith('nums')]
+
+def enable(modules = _default_modules):
+	'''Starts recording calls to the functions of 'modules' (names of 'nums' submodules), which are imported if needed
+	The functions are replaced by their instrumented versions everywhere they are bound in 'nums', including aliases such as Fraction.__radd__
+	and the names that other modules star-imported, so internal calls are recorded too.'''
+	if isinstance(modules, str): modules = (modules,)
+	targets = {}
+	for module in modules:
+		__import__('nums.' + module)
+		targets.update(_targets(sys.modules['nums.' + module]))
+	wrappers = dict((function, _wrap(name, function)) for function, name in targets.items())
+	with _lock:
+		for owner in _owners():
+			for name, value in list(vars(owner).items()):
+				if isinstance(value, types.FunctionType) and value in wrappers:
+					setattr(owner, name, wrappers[value])
+					_state['patched'].append((owner, name, value))
+
+def disable():
+	'''Stops recording, putting the original functions back; the statistics are kept until reset()'''
+	with _lock:
+		for owner, name, original in reversed(_state['patched']):
+			setattr(owner, name, original)
+		_state['patched'] = []
+		for owner in _owners(): # wrappers that were bound later, such as names the lazy 'nums' package looked up while recording
+			for name, value in list(vars(owner).items()):
+				if hasattr(value, '_instrumented'): setattr(owner, name, value._instrumented)
+
+def enabled():
+	'''Returns whether calls are being recorded'''
+	return bool(_state['patched'])
+
+def reset():
+	'''Discards the statistics recorded so far'''
+	with _lock:
+		_state['stats'] = {}
+
+def snapshot():
+	'''Returns the statistics recorded so far as a dict: {qualified function name: {calls, total, mean, min, max, p50, p90, p99,
+	latency_histogram, size_histogram, callers}}. Times are in seconds; the histograms map the upper bound of each bucket to its count'''
+	with _lock:
+		return dict((name, stats.summary()) for name, stats in _state['stats'].items())
+
+def to_json(indent = None):
+	'''Returns snapshot() as a JSON string'''
+	data = snapshot()
+	for summary in data.values():
+		for key in ('latency_histogram', 'size_histogram'):
+			summary[key] = dict((str(bucket), count) for bucket, count in summary[key].items())
+	return json.dumps(data, indent = indent, sort_keys = True)
+
+def _text(data):
+	'''Formats a snapshot as a table, sorted by total time'''
+	lines = ['{0:<44} {1:>9} {2:>11} {3:>11} {4:>11} {5:>11}'.format('function', 'calls', 'total (ms)', 'p50 (us)', 'p99 (us)', 'max (us)')]
+	for name, summary in sorted(data.items(), key = lambda item: -item[1]['total']):
+		lines.append('{0:<44} {1:>9} {2:>11.3f} {3:>11.1f} {4:>11.1f} {5:>11.1f}'.format(name, summary['calls'], summary['total'] * 1e3,
+			summary['p50'] * 1e6, summary['p99'] * 1e6, summary['max'] * 1e6))
+	return '\n'.join(lines)
+
+class report(object):
+	'''Context manager that records the calls made inside its block separately:
+	>>> with report() as r:
+	...     n_primes(100)
+	>>> r.snapshot['nums.sequences._isPrime']['callers']
+	{'nums.sequences.n_primes': 270}
+	Instrumentation is enabled for the block if it was off. Afterwards, the block's statistics are also added to the package-wide ones.'''
+	def __init__(self, modules = _default_modules):
+		self.modules, self.snapshot = modules, None
+
+	def __enter__(self):
+		self.was_enabled = enabled()
+		if not self.was_enabled: enable(self.modules)
+		with _lock:
+			self.outer, _state['stats'] = _state['stats'], {}
+		return self
+
+	def __exit__(self, *exc_info):
+		self.snapshot = snapshot()
+		with _lock:
+			inner, _state['stats'] = _state['stats'], self.outer
+			for name, stats in inner.items():
+				_state['stats'].setdefault(name, _Stats()).merge(stats)
+		if not self.was_enabled: disable()
+		return False
+
+	def text(self):
+		'''Returns the recorded statistics as a table'''
+		return _text(self.snapshot or {})
+
+### Example to show the module's capabilities
+
+def example():
+	'''Example of the module's capabilities'''
+	from nums.sequences import n_primes
+	with report() as r:
+		n_primes(500)
+	print(r.text())
+
+if __name__ == '__main__':
+	help('nums.instrument')
@@ -35,21 +35,97 @@ OVERVIEW:
 from __future__ import division
 import decimal
 import types
+import cmath
 import math
-import re
 
 from nums.sequences import *
 from nums.bases import *
 from nums.errors import *
+from nums.errors import _numpy, _validation, _integer
+
+try:
+	from math import gcd as _gcd # Python 3.5+
+except ImportError:
+	from fractions import gcd as _gcd
 	
 __version__ = 1.22
 __author__ = "Rushy Panchal"
 	
+### Arbitrary-precision constants
+# Each constant is cached at the highest precision computed so far, so any request at that precision or lower is free
+
+_constants = {'pi': (0, None), 'e': (0, None)}
+
+def _chudnovsky(a, b):
+	'''Binary splitting of the terms [a, b) of the Chudnovsky series; returns the integers (P, Q, T)'''
+	if b - a == 1:
+		if a == 0: 
+			p = q = 1
+		else:
+			p = (6 * a - 5) * (2 * a - 1) * (6 * a - 1)
+			q = a * a * a * 10939058860032000 # 640320**3 / 24
+		t = p * (13591409 + 545140134 * a)
+		return p, q, (-t if a & 1 else t)
+	m = (a + b) // 2
+	p1, q1, t1 = _chudnovsky(a, m)
+	p2, q2, t2 = _chudnovsky(m, b)
+	return p1 * p2, q1 * q2, q2 * t1 + p1 * t2
+
+def _e_series(a, b):
+	'''Binary splitting of the sum of a!/k! for k in (a, b]; returns the integers (P, Q)'''
+	if b - a == 1: return 1, b
+	m = (a + b) // 2
+	p1, q1 = _e_series(a, m)
+	p2, q2 = _e_series(m, b)
+	return p1 * q2 + p2, q1 * q2
+
+def decPi(precision = None):
+	'''Returns pi as a Decimal to 'precision' digits (the active decimal context precision by default)
+	>>> decimal.getcontext().prec = 50
+	>>> decPi()
+	Decimal('3.1415926535897932384626433832795028841971693993751')'''
+	digits = precision or decimal.getcontext().prec
+	if _constants['pi'][0] < digits:
+		with decimal.localcontext() as context:
+			context.prec = digits + 10
+			p, q, t = _chudnovsky(0, digits // 14 + 2) # each term adds about 14 digits
+			_constants['pi'] = (digits, decimal.Decimal(426880) * decimal.Decimal(10005).sqrt() * q / t)
+	with decimal.localcontext() as context:
+		context.prec = digits
+		return +_constants['pi'][1]
+	
+def decE(precision = None):
+	'''Returns e as a Decimal to 'precision' digits (the active decimal context precision by default)
+	>>> decimal.getcontext().prec = 50
+	>>> decE()
+	Decimal('2.7182818284590452353602874713526624977572470937000')'''
+	digits = precision or decimal.getcontext().prec
+	if _constants['e'][0] < digits:
+		with decimal.localcontext() as context:
+			context.prec = digits + 10
+			n, size = 1, 0.0
+			while size < context.prec: # n! must exceed 10**prec
+				n += 1
+				size += math.log10(n)
+			p, q = _e_series(0, n)
+			_constants['e'] = (digits, 1 + decimal.Decimal(p) / q)
+	with decimal.localcontext() as context:
+		context.prec = digits
+		return +_constants['e'][1]
+	
 ### Constants
 
-pi = decimal.Decimal(math.pi)
-tau = pi * 2
-e = decimal.Decimal(math.e)
+with decimal.localcontext() as _context: # fixed, so the constants do not depend on the precision in use when 'nums' first loads this module
+	_context.prec = 50
+	pi = decPi()
+	tau = pi * 2
+	e = decE()
+del _context
+
+# exact values of the trigonometric functions at special angles, keyed by the angle in degrees
+_sines = {0: 0, 30: 0.5, 90: 1, 150: 0.5, 180: 0, 210: -0.5, 270: -1, 330: -0.5}
+_cosines = {0: 1, 60: 0.5, 90: 0, 120: -0.5, 180: -1, 240: -0.5, 270: 0, 300: 0.5}
+_tangents = {0: 0, 45: 1, 90: None, 135: -1, 180: 0, 225: 1, 270: None, 315: -1}
 
 ### Main functions
 	
@@ -59,7 +135,7 @@ def factors(n):
 	[5, 25]
 	>>> factors(144)
 	[1, 2, 3, 4, 6, 8, 9, 12, 24, 72, 144]"""
-	if not isinstance(n, types): raise NumericalError(type_(getError('int')))
+	if _validation.enabled and not isinstance(n, types): raise NumericalError(type_(getError('int')))
 	fList, num, limit = [], n, int(n**0.5) + 1
 	for factor in xrange(1, limit):
 		if n % factor == 0:
@@ -78,28 +154,43 @@ def pFactors(n):
 	[5, 5]
 	>>> pFactors(144)
 	[2, 2, 2, 2, 3, 3]"""
-	if not isinstance(n, types): raise NumericalError(type_(getError('int')))
-	if n < 1: raise NumericalError(value_('must be greater than 1'))
-	pFact, limit, check, num = [], int(n**0.5) + 1, 2, n
-	if isPrime(n): return [n]
-	for check in xrange(2, limit):
-		if isPrime(check) and  num % check == 0:
-			pFact.append(int(check))
-			num /= check
-		if isPrime(num):
-			pFact.append(int(num))
-			break
-		while num % check == 0:
-			pFact.append(int(check))
-			num /= check
-	return sorted(pFact)
+	if _validation.enabled:
+		if not isinstance(n, types) or n != int(n): raise NumericalError(type_(getError('int')))
+		if n < 1: raise NumericalError(value_('must be greater than 1'))
+	return _pFactors(int(n))
+
+def _pFactors(n):
+	"""Unchecked kernel of pFactors for an int 'n' >= 1: divides out 2, 3 and the numbers 6k - 1 and 6k + 1 while they are at most the square root of what is left"""
+	pFact, n = _trialDivision(n)
+	if n > 1: pFact.append(n)
+	return pFact
+
+def _trialDivision(n, low = 5, high = None):
+	"""Divides the numbers 6k - 1 and 6k + 1 from 'low' (5 mod 6) up to 'high' out of 'n', while they are at most the square root of what is left
+	(and 2 and 3 first, when 'low' is 5). Returns the factors found and the part of 'n' that is left; running consecutive ranges one after another
+	gives the same factors as a single call, which is how nums.aio splits the work"""
+	pFact = []
+	if low == 5:
+		for check in (2, 3):
+			while n % check == 0:
+				pFact.append(check)
+				n //= check
+	check = low
+	while check * check <= n and (high is None or check < high):
+		for divisor in (check, check + 2):
+			while n % divisor == 0:
+				pFact.append(divisor)
+				n //= divisor
+		check += 6
+	return pFact, n
  
 def commonFactors(a, b):
 	'''Returns the common factors of a and b
 	>>> commonFactors(25, 144)
 	[1]'''
-	for elem in (a, b):
-		if not isinstance(elem, types): raise NumericalError(type_(getError('num')))
+	if _validation.enabled:
+		for elem in (a, b):
+			if not isinstance(elem, types): raise NumericalError(type_(getError('num')))
 	aFactors, bFactors, common_factors = factors(a), factors(b), []
 	for factor in aFactors:
 		if factor in bFactors: common_factors.append(factor)
@@ -109,10 +200,17 @@ def gcf(a, b):
 	"""Returns the greatest common factors of 'a' and 'b'
 	>>> gcf(25, 144)
 	1"""
-	for elem in (a, b):
-		if not isinstance(elem, types): raise NumericalError(getError('int'))
-	if a % b == 0 or b % a == 0: return min(a, b)
-	return max(commonFactors(a, b))
+	if _validation.enabled:
+		for elem in (a, b):
+			if not isinstance(elem, types): raise NumericalError(type_(getError('int')))
+	return _gcf(a, b)
+
+def _gcf(a, b):
+	"""Unchecked kernel of gcf: Euclid's algorithm (math.gcd for ints)"""
+	if type(a) is int and type(b) is int: return _gcd(a, b)
+	while b:
+		a, b = b, a % b
+	return abs(a)
 
 _round = round
 
@@ -125,26 +223,91 @@ def round(n, base = 10):
 	return type(n)(_round(float(n) / base) * base)
 
 def quadForm(a, b, c):
-	'''Returns the x-intercepts of a quadratic equation
+	'''Returns the x-intercepts of a quadratic equation; (nan, nan) if there are none (quadForm_many can return the complex roots)
 	>>> quadForm(1, -4, 0)
-	(4.0, 0.0)'''
+	(4.0, 0.0)
+	>>> quadForm(1, -2, 1)
+	(1.0, 1.0)
+	>>> quadForm(1, 0, 1)
+	(nan, nan)'''
 	for elem in (a, b, c):
-		if not isinstance(elem, (types, FloatType)): raise NumericalError(type_(getError('float')))
-	if b**2 > 4 * a * c:
-		x1 = (-b + (b**2 - 4 * a * c)**0.5) / (2 * a)
-		x2 = (-b - (b**2 - 4 * a * c)**0.5) / (2 * a)
-		return (x1, x2)
-	else:
-		return (0, 0)
+		if not isinstance(elem, types): raise NumericalError(type_(getError('float')))
+	discriminant = b**2 - 4 * a * c
+	if discriminant < 0: return (float('nan'), float('nan'))
+	return _quadratic(a, b, c, discriminant**0.5)
+	
+def _quadratic(a, b, c, root):
+	'''Returns the roots (-b + root) / 2a and (-b - root) / 2a of a quadratic, where root is the square root of the discriminant
+	The root whose terms cancel out is found from c / q instead, which keeps both roots accurate'''
+	q = -0.5 * (b + root) if b >= 0 else -0.5 * (b - root)
+	if q == 0: return (0.0, 0.0) # b = c = 0
+	return (c / q, q / a) if b >= 0 else (q / a, c / q)
+	
+def quadForm_many(a, b, c, complex_roots = False):
+	'''Solves many quadratic equations a*x**2 + b*x + c = 0 at once
+	'a', 'b' and 'c' are arrays, iterables, or single numbers (which are used for every equation).
+	Returns the arrays (x1, x2) of roots in the same order as quadForm; NumPy arrays if NumPy is installed, lists otherwise.
+	Equations without real roots have nan roots unless 'complex_roots' is True, in which case complex roots are returned.
+	An equation with a = 0 has the single root -c/b in x1, and nan in x2; with a = b = 0 both are nan.
+	>>> quadForm_many([1, 1, 1], [-4, -2, 0], [0, 1, 1])
+	(array([ 4.,  1., nan]), array([ 0.,  1., nan]))
+	>>> quadForm_many(1, 0, [1, 4], complex_roots = True)
+	(array([-0.+1.j, -0.+2.j]), array([-0.-1.j, -0.-2.j]))'''
+	numpy = _numpy()
+	if numpy is None:
+		return _quadForm_loop(a, b, c, complex_roots)
+	a, b, c = [list(elem) if hasattr(elem, '__iter__') and not isinstance(elem, numpy.ndarray) else elem for elem in (a, b, c)]
+	a, b, c = numpy.broadcast_arrays(*[numpy.asarray(elem, dtype = float) for elem in (a, b, c)])
+	with numpy.errstate(all = 'ignore'):
+		discriminant = b * b - 4 * a * c
+		root = numpy.sqrt(discriminant.astype(complex) if complex_roots else discriminant)
+		positive = b >= 0
+		q = -0.5 * (b + numpy.where(positive, root, -root))
+		small, large = c / q, q / a
+		x1, x2 = numpy.where(positive, small, large), numpy.where(positive, large, small)
+		x1[q == 0], x2[q == 0] = 0, 0
+		linear = a == 0
+		x1[linear], x2[linear] = numpy.where(b[linear] != 0, -c[linear] / b[linear], numpy.nan), numpy.nan
+	return x1, x2
+	
+def _quadForm_loop(a, b, c, complex_roots):
+	'''quadForm_many without NumPy'''
+	columns = [list(elem) if hasattr(elem, '__iter__') else None for elem in (a, b, c)] # generators can only be read once
+	length = max([len(column) for column in columns if column is not None] or [1])
+	a, b, c = [column if column is not None else [elem] * length for column, elem in zip(columns, (a, b, c))]
+	nan = float('nan')
+	x1, x2 = [], []
+	for a, b, c in zip(a, b, c):
+		if a == 0:
+			roots = (-c / b if b != 0 else nan, nan)
+		else:
+			discriminant = b * b - 4 * a * c
+			if discriminant >= 0:
+				roots = _quadratic(a, b, c, discriminant**0.5)
+			elif complex_roots:
+				roots = _quadratic(a, b, c, cmath.sqrt(discriminant))
+			else:
+				roots = (nan, nan)
+		x1.append(roots[0])
+		x2.append(roots[1])
+	return x1, x2
 
 def integral(f, n = 1000, start = 0, stop = 100, method = 't', return_shapes = False):
 	"""Returns the integral of function with 'n' shapes
 	>>> integral('x**2')
-	333333.4994999992
+	333333.50000000006
 	>>> integral('x**2', n = 10000, start = 0, stop = 100, method = 'middle')
-	333333.3324997804
+	333333.33249999984
 	
 	If return_shapes is True, then the shape dimensions are returned as well"""
+	n, method = _integral_arguments(f, n, start, stop, method, return_shapes)
+	first, last = _samples(method, n)
+	total, shapes = _integral(f, n, start, stop, method, first, last, return_shapes)
+	area = _area(method, (stop - start) / n, total)
+	return (area, shapes) if return_shapes else area
+
+def _integral_arguments(f, n, start, stop, method, return_shapes):
+	"""Validates the arguments of integral; returns the number of shapes (made even for Simpson's rule) and the method's first letter"""
 	for elem in (n, start, stop):
 		if not isinstance(elem, types): raise NumericalError(type_(getError('int')))
 	if not isinstance(f, (StringType, FunctionType)): raise NumericalError(type_("must be str or function"))
@@ -155,69 +318,43 @@ def integral(f, n = 1000, start = 0, stop = 100, method = 't', return_shapes = F
 	method = method.lower()[0]
 	if method not in ('l', 'm', 'r', 't', 's'):
 		raise NumericalError(value_("The method must be 'left', 'middle', 'right', 'trapezoid', or 'Simpsons'"))
+	n = int(n)
+	if method == 's' and n % 2 != 0: n += 1 # Simpson's rule needs an even number of shapes
+	return n, method
+
+def _samples(method, n):
+	"""Returns the range [first, last) of the sample indices that the composite rule 'method' uses with 'n' shapes"""
+	return {'l': (0, n), 'm': (0, n), 'r': (1, n + 1), 't': (0, n + 1), 's': (0, n + 1)}[method]
+
+def _area(method, increment, total):
+	"""Returns the integral from the weighted sum of the samples of the composite rule 'method' """
+	if method == 't': return increment / 2 * total
+	if method == 's': return increment / 3 * total
+	return increment * total
+
+def _integral(f, n, start, stop, method, first, last, return_shapes = False):
+	"""Unchecked kernel of integral: returns the weighted sum of the samples of 'f' with indices in [first, last) of the composite rule 'method'
+	with 'n' shapes, and the shapes that end at those samples (no shapes for Simpson's rule). Sample i is at start + i*increment (the middle of
+	shape i for the midpoint rule), computed from its index, so consecutive ranges of indices add up to the whole integral; nums.aio splits it that way"""
 	funct = lambda x: ((math_eval(f, {"__builtins__": math}, {'x': x})) if isinstance(f, str) else (f(x)))
 	increment = (stop - start) / n
-	num, x, shapes = 0, start, []
-	if method == 'l':
-		stop -= increment
-		while x <= stop:
-			y = funct(x)
-			num += y
-			if return_shapes:
-				shapes.append([(x, 0), (x, y), (x + increment, y), (x + increment, 0)])
-			x += increment
-		return (increment * num, shapes) if return_shapes else increment * num
-	elif method == 'r':
-		start += increment
-		x = start
-		while x <= stop:
-			y = funct(x)
-			num += y
-			if return_shapes:
-				shapes.append([(x - increment, 0), (x - increment, y), (x, y), (x, 0)])
-			x += increment
-		return (increment * num, shapes) if return_shapes else increment * num
-	elif method == 'm':
-		change = increment * 0.5
-		start += change
-		x = start
-		while x <= stop:
-			y = funct(x)
-			num += y
-			if return_shapes:
-				shapes.append([(x - change, 0), (x - change, y), (x + change, y), (x + change, 0)])
-			x += increment
-		return (increment * num, shapes) if return_shapes else increment * num
-	elif method == 't':
+	offset = 0.5 if method == 'm' else 0
+	num, shapes = 0, []
+	previous = funct(start + (first - 1) * increment) if method == 't' and return_shapes and first > 0 else None
+	for i in range(first, last):
+		x = start + (i + offset) * increment
 		y = funct(x)
-		num += y
-		oY = y
+		if method == 's': num += y if i == 0 or i == n else (4 if i % 2 else 2) * y
+		elif method == 't': num += y if i == 0 or i == n else 2 * y
+		else: num += y
 		if return_shapes:
-			shapes.append([(x, 0), (x, 0), (x + increment, y), (x + increment, 0)])
-		x += increment
-		while x <= stop:
-			y = funct(x)
-			num += 2 * y
-			if return_shapes:
-				shapes.append([(x - increment, 0), (x - increment, oY), (x, y), (x, 0)])
-			x += increment
-			oY = y
-		y = funct(x)
-		num += y
-		if return_shapes:
-			shapes.append([(x - increment, 0), (x - increment, oY), (x, y), (x, 0)])
-		return (increment / 2 * num, shapes) if return_shapes else increment / 2* num
-	elif method == 's':
-		if n % 2 != 0: n += 1
-		count = 2
-		num += 2 * funct(x)
-		while x <= (stop - increment):
-			x += increment
-			multiplier = 4 if count % 2 == 0 else 2
-			y = multiplier * funct(x)
-			num += y
-			count += 1
-		return (increment / 3* num, shapes) if return_shapes else increment / 3 * num
+			if method == 'l': shapes.append([(x, 0), (x, y), (x + increment, y), (x + increment, 0)])
+			elif method == 'r': shapes.append([(x - increment, 0), (x - increment, y), (x, y), (x, 0)])
+			elif method == 'm': shapes.append([(x - increment / 2, 0), (x - increment / 2, y), (x + increment / 2, y), (x + increment / 2, 0)])
+			elif method == 't':
+				if i > 0: shapes.append([(x - increment, 0), (x - increment, previous), (x, y), (x, 0)])
+				previous = y
+	return num, shapes
 	
 def triangleArea(a, b, c, h = None):
 	"""Returns the area of a triangle with the largest side as the base
@@ -235,97 +372,312 @@ def triangleArea(a, b, c, h = None):
 		return (s * (s - a) * (s - b) * (s - c))**0.5
 	return 0.5 * h * max(a, b, c)
 	
+def decExp(x):
+	"""e**x as a Decimal to the active decimal context precision
+	>>> decExp(1) == decE()
+	True"""
+	if not isinstance(x, types + (decimal.Decimal,)): raise NumericalError(type_(getError('num')))
+	return decimal.Decimal(x).exp()
+
+def _reduce(x):
+	"""Reduces the Decimal 'x' (in radians) to [-pi, pi]; the context precision must already include guard digits"""
+	if abs(x) <= 3: return x
+	with decimal.localcontext() as context:
+		context.prec += max(x.adjusted(), 0) # the integer part of x / tau is discarded
+		tau = 2 * decPi()
+		x %= tau
+		if x > tau / 2: x -= tau
+		elif x < -tau / 2: x += tau
+	return +x
+
+def decSin(x):
+	"""sin(x) of an angle in radians as a Decimal, to the active decimal context precision
+	>>> decimal.getcontext().prec = 40
+	>>> decSin(1)
+	Decimal('0.8414709848078965066525023216302989996226')"""
+	if not isinstance(x, types + (decimal.Decimal,)): raise NumericalError(type_(getError('num')))
+	with decimal.localcontext() as context:
+		context.prec += 10
+		x = _reduce(decimal.Decimal(x))
+		i, last, total, fact, num, sign = 1, 0, x, 1, x, 1
+		while total != last: # Taylor series
+			last = total
+			i += 2
+			fact *= i * (i - 1)
+			num *= x * x
+			sign = -sign
+			total += num / fact * sign
+	return +total
+
+def decCos(x):
+	"""cos(x) of an angle in radians as a Decimal, to the active decimal context precision
+	>>> decimal.getcontext().prec = 40
+	>>> decCos(1)
+	Decimal('0.5403023058681397174009366074429766037323')"""
+	if not isinstance(x, types + (decimal.Decimal,)): raise NumericalError(type_(getError('num')))
+	with decimal.localcontext() as context:
+		context.prec += 10
+		x = _reduce(decimal.Decimal(x))
+		i, last, total, fact, num, sign = 0, 0, 1, 1, 1, 1
+		while total != last: # Taylor series
+			last = total
+			i += 2
+			fact *= i * (i - 1)
+			num *= x * x
+			sign = -sign
+			total += num / fact * sign
+	return +total
+
+def decTan(x):
+	"""tan(x) of an angle in radians as a Decimal, to the active decimal context precision
+	>>> decimal.getcontext().prec = 40
+	>>> decTan(1)
+	Decimal('1.557407724654902230506974807458360173087')"""
+	if not isinstance(x, types + (decimal.Decimal,)): raise NumericalError(type_(getError('num')))
+	with decimal.localcontext() as context:
+		context.prec += 5
+		result = decSin(x) / decCos(x)
+	return +result
+
+def _decimal_trig(angle, degrees, function, table):
+	"""Evaluates the Decimal 'function' at the Decimal 'angle', snapping special angles to their exact values from 'table'"""
+	precision = decimal.getcontext().prec
+	with decimal.localcontext() as context:
+		context.prec += 10
+		radian = decPi() / 180
+		deg = angle if degrees else angle / radian
+		turn = deg % 360
+		nearest = turn.to_integral_value()
+		if abs(turn - nearest) <= abs(deg) * decimal.Decimal(10) ** (2 - precision):
+			nearest = int(nearest) % 360
+			if nearest in table: 
+				return None if table[nearest] is None else decimal.Decimal(str(table[nearest]))
+		if degrees: angle = angle * radian
+	return function(angle)
+
+def _trig(angle, degrees, function, table):
+	"""Evaluates 'function' at 'angle', snapping special angles to their exact values from 'table'"""
+	if isinstance(angle, decimal.Decimal):
+		return _decimal_trig(angle, degrees, _decimal_functions[function], table)
+	deg = angle if degrees else math.degrees(angle)
+	if math.isinf(deg) or math.isnan(deg): return function(angle)
+	nearest = _round(deg) # reducing modulo 360 first would round tiny negative angles up to 360
+	if abs(deg - nearest) <= 1e-13 * abs(deg): # the angle is a whole number of degrees, up to rounding
+		nearest %= 360
+		if nearest in table: return table[nearest]
+	return function(math.radians(angle) if degrees else angle)
+
+def _trigs(angles, degrees, function, table):
+	"""Evaluates 'function' over an array or iterable of angles, snapping special angles like _trig"""
+	if isinstance(angles, str) or not hasattr(angles, '__iter__'): raise NumericalError(type_(getError('num')))
+	numpy = _numpy()
+	if numpy is None:
+		return [_trig(angle, degrees, function, table) for angle in angles]
+	angles = numpy.asarray(angles, dtype = float)
+	deg = angles if degrees else numpy.degrees(angles)
+	with numpy.errstate(all = 'ignore'):
+		results = getattr(numpy, function.__name__)(numpy.radians(angles) if degrees else angles)
+	nearest = numpy.round(deg)
+	with numpy.errstate(invalid = 'ignore'):
+		special = numpy.abs(deg - nearest) <= 1e-13 * numpy.abs(deg)
+		nearest = numpy.mod(nearest, 360)
+	for key, value in table.items():
+		results[special & (nearest == key)] = numpy.nan if value is None else value
+	return results
+
+_decimal_functions = {math.sin: decSin, math.cos: decCos, math.tan: decTan}
+
 def sinR(angle):
 	"""sin(angle) measured in radians
+	'angle' can also be an array or iterable of angles, which returns a NumPy array (or a list without NumPy).
+	Decimal angles are computed to the active decimal context precision.
 	>>> sinR(pi*2)
 	0
 	>>> sinR(3*pi / 2)
 	-1"""
-	if not isinstance(angle, types + (decimal.Decimal,)): raise NumericalError(type_(getError('num')))
-	sines = {0.0: 0, 0.5235987755982988: 0.5, 1.5707963267948966: 1, 3.6651914291880923: -0.5, 6.283185307179586: 0, 3.141592653589793: 0, 
-	5.759586531581287: -0.5, 2.6179938779914944: 0.5, 4.71238898038469: -1}
-	angle = round(angle, 17)
-	return sines.get(angle, math.sin(angle))
+	if isinstance(angle, types + (decimal.Decimal,)): return _trig(angle, False, math.sin, _sines)
+	return _trigs(angle, False, math.sin, _sines)
 	
 def cosR(angle):
 	"""cos(angle) measured in radians
+	'angle' can also be an array or iterable of angles, which returns a NumPy array (or a list without NumPy).
+	Decimal angles are computed to the active decimal context precision.
 	>>> cosR(pi*2)
 	1
 	>>> cosR(3*pi / 2)
 	0"""
-	if not isinstance(angle, types + (decimal.Decimal,)): raise NumericalError(type_(getError('num')))
-	cosines = {4.1887902047863905: -0.5, 2.0943951023931953: -0.5, 
-	1.5707963267948966: 0, 3.141592653589793: -1, 6.283185307179586: 1, 5.235987755982989: 0.5, 4.71238898038469: 0, 1.0471975511965976: 0.5}
-	angle = round(angle, 17)
-	return cosines.get(angle, math.cos(angle))
+	if isinstance(angle, types + (decimal.Decimal,)): return _trig(angle, False, math.cos, _cosines)
+	return _trigs(angle, False, math.cos, _cosines)
 	
 def tanR(angle): 
-	"""tan(angle) measured in radians
+	"""tan(angle) measured in radians; undefined tangents are None (nan in arrays)
+	'angle' can also be an array or iterable of angles, which returns a NumPy array (or a list without NumPy).
+	Decimal angles are computed to the active decimal context precision.
 	>>> tanR(pi*2)
 	0
 	>>> tanR(pi)
 	0"""
-	if not isinstance(angle, types + (decimal.Decimal,)): raise NumericalError(type_(getError('num')))
-	tangents = {3.9269908169872414: 1, 5.497787143782138: -1, 1.5707963267948966: None, 
-	4.71238898038469: None, 0.7853981633974483: 1, 6.283185307179586: 0, 3.141592653589793: 0, 2.356194490192345: -1}
-	angle = round(angle, 17)
-	return tangents.get(angle, math.tan(angle))
+	if isinstance(angle, types + (decimal.Decimal,)): return _trig(angle, False, math.tan, _tangents)
+	return _trigs(angle, False, math.tan, _tangents)
 	
 def sinD(angle):
 	"""sin(angle) measured in degrees
+	'angle' can also be an array or iterable of angles, which returns a NumPy array (or a list without NumPy).
+	Decimal angles are computed to the active decimal context precision.
 	>>> sinD(90)
 	1
 	>>> sinD(180)
 	0"""
-	if not isinstance(angle, types + (decimal.Decimal,)): raise NumericalError(type_(getError('num')))
-	return sinR(degToRad(angle))
+	if isinstance(angle, types + (decimal.Decimal,)): return _trig(angle, True, math.sin, _sines)
+	return _trigs(angle, True, math.sin, _sines)
 
 def cosD(angle):
 	"""cos(angle) measured in degrees
+	'angle' can also be an array or iterable of angles, which returns a NumPy array (or a list without NumPy).
+	Decimal angles are computed to the active decimal context precision.
 	>>> cosD(90)
 	0
 	>>> cosD(180)
 	-1"""
-	if not isinstance(angle, types + (decimal.Decimal,)): raise NumericalError(type_(getError('num')))
-	return cosR(degToRad(angle))
+	if isinstance(angle, types + (decimal.Decimal,)): return _trig(angle, True, math.cos, _cosines)
+	return _trigs(angle, True, math.cos, _cosines)
 
 def tanD(angle):
-	"""sin(angle) measured in degrees
-	>>> tanD(90)
-	0
-	>>> tanD(270)
+	"""tan(angle) measured in degrees; undefined tangents are None (nan in arrays)
+	'angle' can also be an array or iterable of angles, which returns a NumPy array (or a list without NumPy).
+	Decimal angles are computed to the active decimal context precision.
+	>>> tanD(45)
+	1
+	>>> tanD(180)
 	0"""
-	if not isinstance(angle, types + (decimal.Decimal,)): raise NumericalError(type_(getError('num')))
-	return cosR(degToRad(angle))
+	if isinstance(angle, types + (decimal.Decimal,)): return _trig(angle, True, math.tan, _tangents)
+	return _trigs(angle, True, math.tan, _tangents)
 	
 def degToRad(degrees):
 	"""Converts degrees to radians
 	>>> degToRad(90)
 	1.5707963267948966"""
-	if not isinstance(degrees, types + (decimal.Decimal,)): raise NumericalError(type_(getError('num')))
-	return math.radians(degrees)
+	if isinstance(degrees, types + (decimal.Decimal,)): return math.radians(degrees)
+	if isinstance(degrees, str) or not hasattr(degrees, '__iter__'): raise NumericalError(type_(getError('num')))
+	numpy = _numpy()
+	return numpy.radians(numpy.asarray(degrees, dtype = float)) if numpy is not None else [math.radians(angle) for angle in degrees]
 
 def radToDeg(radians):
 	"""Converts radians to degrees
 	>>> radToDeg(pi)
 	180.0"""
-	if not isinstance(radians, types + (decimal.Decimal,)): raise NumericalError(type_(getError('num')))
-	return math.degrees(radians)
+	if isinstance(radians, types + (decimal.Decimal,)): return math.degrees(radians)
+	if isinstance(radians, str) or not hasattr(radians, '__iter__'): raise NumericalError(type_(getError('num')))
+	numpy = _numpy()
+	return numpy.degrees(numpy.asarray(radians, dtype = float)) if numpy is not None else [math.degrees(angle) for angle in radians]
 	
+try:
+	_ranges = (xrange,) # Python 2, where range() returns a list
+except NameError:
+	_ranges = (range,)
+
+_whole = tuple(t for t in types if t is not float) # int, and long in Python 2.x
+
 def gaussSum(numbers):
 	'''Returns the Gaussian Sum of a sequence of numbers
-	Same as sum(numbers) but more efficient
-	Assumes that the sequence is not sporadic
+	Same as sum(numbers) but more efficient; ranges are summed in closed form, so they are never built
+	Assumes that the sequence is not sporadic (an arithmetic sequence)
 	>>> gaussSum(range(1, 101))
-	5050.0
+	5050
 	>>> sum(range(1, 101))
 	5050
-	>>> timeit(stmt = 'gaussSum(range(1, 10001))', setup = 'from nums import gaussSum', number = 1000)
-	0.48374609368082133
-	>>> timeit(stmt = 'sum(range(1, 10001))', number = 1000)
-	0.8427124772011041'''
-	if not isinstance(numbers, (ListType, SetType, TupleType)): raise NumericalError(type_(getError('iters')))
-	return (numbers[0] + numbers[-1]) * (len(numbers) / 2)
+	>>> gaussSum(range(1, 10**12 + 1))
+	500000000000500000000000
+	>>> gaussSum([decimal.Decimal('0.5'), decimal.Decimal('1.0')])
+	Decimal('1.5')'''
+	if isinstance(numbers, _ranges) and hasattr(numbers, 'start'):
+		return arith_sum(numbers.start, numbers.stop, numbers.step)
+	if not isinstance(numbers, (list, set, frozenset, tuple) + _ranges): raise NumericalError(type_("must be list, set, tuple, or range"))
+	if not numbers: return 0
+	first, last = (min(numbers), max(numbers)) if isinstance(numbers, (set, frozenset)) else (numbers[0], numbers[-1])
+	total = (first + last) * len(numbers)
+	return total // 2 if isinstance(total, _whole) else total / 2 # (first + last) * count is even for integer sequences
+	
+def _count(start, stop, step):
+	'''Returns len(range(start, stop, step)) without building the range (which may be too large for len())'''
+	if step == 0: raise NumericalError(value_("step must not be zero"))
+	if step > 0: return max(0, (stop - start + step - 1) // step)
+	return max(0, (start - stop - step - 1) // -step)
+	
+def arith_sum(start, stop = None, step = 1):
+	'''Returns the sum of range(start, stop, step) exactly, in constant time
+	Like range(), arith_sum(n) is the sum of 0 to n - 1
+	>>> arith_sum(1, 101)
+	5050
+	>>> arith_sum(10, 0, -3)
+	22'''
+	if stop is None: start, stop = 0, start
+	start, stop, step = _integer(start), _integer(stop), _integer(step)
+	count = _count(start, stop, step)
+	return count * start + step * (count * (count - 1) // 2)
+	
+_bernoulli = []
+
+def _bernoulli_numbers(n):
+	'''Returns the Bernoulli numbers B_0 to B_n (with B_1 = +1/2) as Fractions, computed once with the Akiyama-Tanigawa algorithm'''
+	from nums.Fraction import Fraction
+	while len(_bernoulli) <= n:
+		m = len(_bernoulli)
+		a = [Fraction(1, j + 1) for j in range(m + 1)]
+		for i in range(1, m + 1):
+			for j in range(m - i + 1):
+				a[j] = (j + 1) * (a[j] - a[j + 1])
+		_bernoulli.append(a[0])
+	return _bernoulli
+	
+def _faulhaber(n, k):
+	'''Returns 1**k + 2**k + ... + n**k (for n >= 0, k >= 1) with Faulhaber's formula, in O(k) steps'''
+	bernoulli = _bernoulli_numbers(k)
+	total, binomial, power = 0, 1, n ** (k + 1)
+	for j in range(k + 1):
+		total = bernoulli[j] * binomial * power + total
+		binomial = binomial * (k + 1 - j) // (j + 1)
+		power //= n or 1
+	total = total / (k + 1)
+	return total.num
+	
+def power_sum(numbers, k):
+	'''Returns the sum of x**k over a range exactly, without iterating over it
+	'numbers' is a range, or a (start, stop[, step]) tuple with the same meaning as range()'s arguments.
+	Ranges with a step of 1 take O(k) arithmetic operations, and others O(k**2).
+	>>> power_sum(range(1, 11), 2)
+	385
+	>>> power_sum((1, 10**12 + 1), 3) == gaussSum(range(1, 10**12 + 1))**2
+	True'''
+	if isinstance(numbers, _ranges) and hasattr(numbers, 'start'): 
+		start, stop, step = numbers.start, numbers.stop, numbers.step
+	elif isinstance(numbers, tuple) and 1 <= len(numbers) <= 3:
+		start, stop, step = (0, numbers[0], 1) if len(numbers) == 1 else (numbers + (1,))[:3]
+	elif isinstance(numbers, _ranges) and len(numbers) > 0: # Python 2 xrange, which does not expose its arguments
+		start, step = numbers[0], (numbers[1] - numbers[0] if len(numbers) > 1 else 1)
+		stop = numbers[-1] + step
+	else:
+		raise NumericalError(type_("must be a range or a (start, stop, step) tuple"))
+	start, stop, step, k = _integer(start), _integer(stop), _integer(step), _integer(k)
+	if k < 0: raise NumericalError(value_("k must not be negative"))
+	count = _count(start, stop, step)
+	if count == 0: return 0
+	if k == 0: return count
+	first = start if step > 0 else start + (count - 1) * step # sum in increasing order
+	step = abs(step)
+	if step == 1:
+		last = first + count - 1
+		sign = -1 if k % 2 else 1
+		if first > 0: return _faulhaber(last, k) - _faulhaber(first - 1, k)
+		if last < 0: return sign * (_faulhaber(-first, k) - _faulhaber(-last - 1, k))
+		return sign * _faulhaber(-first, k) + _faulhaber(last, k)
+	# sum of (first + i*step)**k for i < count, expanded with the binomial theorem
+	total, binomial = 0, 1
+	for j in range(k + 1):
+		index_sum = _faulhaber(count - 1, j) if j > 0 else count
+		total += binomial * first ** (k - j) * step ** j * index_sum
+		binomial = binomial * (k - j) // (j + 1)
+	return total
 	
 ### Examples to display module's capabilites
 
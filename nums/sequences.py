@@ -26,7 +26,12 @@ OVERVIEW:
 
 from __future__ import division
 from nums.errors import *
+from nums.errors import _numpy, _validation
+from nums.figurate import polygonal_range, triangular, _isqrt
+from array import array
 import collections
+import itertools
+import math
 
 ### Main functions
 
@@ -34,32 +39,32 @@ def prevTriNums(n):
 	"""Returns all of the triangle numbers up to 'n'
 	>>> prevTriNums(25)
 	[1, 3, 6, 10, 15, 21]"""
-	if not isinstance(n, types): raise NumericalError(type_(getError('int')))
-	num, tri_numbers, x = 0, [], 0
-	while num <= n:
-		x += 1
-		num += x
-		if num > n: break
-		tri_numbers.append(num)
-	return tri_numbers
+	if _validation.enabled and not isinstance(n, types): raise NumericalError(type_(getError('int')))
+	return list(polygonal_range(3, 1, int(math.floor(n))))
 
 def triNum(n):
 	"""Returns the 'n'th triangle number
 	>>> triNum(25)
-	325.0"""
-	if not isinstance(n, types): raise NumericalError(type_(getError('int')))
-	return (n**2 + n) / 2
+	325"""
+	if _validation.enabled and not isinstance(n, types): raise NumericalError(type_(getError('int')))
+	return triangular(n)
 	
 def isPrime(n):
 	"""Checks if 'n' is prime
 	>>> isPrime(967)
 	True"""
-	if not isinstance(n, types): raise NumericalError(type_(getError('int')))
-	x = 2
-	if n == 0 or n == 1:
-		return False
-	for check in xrange(2, int(n**0.5+1)):
-		if n % check == 0: return False
+	if _validation.enabled:
+		if not isinstance(n, types): raise NumericalError(type_(getError('int')))
+		if isinstance(n, float) and (math.isinf(n) or math.isnan(n)): raise NumericalError(value_("must be finite"))
+		if n != int(n): return False
+	return _isPrime(int(n))
+
+def _isPrime(n):
+	"""Unchecked kernel of isPrime for an int 'n': trial division by 2, 3 and the numbers 6k - 1 and 6k + 1 up to the square root of 'n'"""
+	if n < 4: return n > 1
+	if n % 2 == 0 or n % 3 == 0: return False
+	for check in xrange(5, _isqrt(n) + 1, 6):
+		if n % check == 0 or n % (check + 2) == 0: return False
 	return True
 
 def primeRange(a, b = None):
@@ -84,8 +89,8 @@ def prime_range(a, b):
 	{5: True, 6: False, 7: True, 8: False, 9: False, 10: False}
 	>>> prime_range(10)
 	{2: True, 3: True, 4: False, 5: True, 6: False, 7: True, 8: False, 9: False, 10: False}'''
-	if not isinstance(a, types): raise NumericalError(type_(getError('int')))
-	if not isinstance(b, types): raise NumericalError(type_(getError('int')))
+	if _validation.enabled and not isinstance(a, types): raise NumericalError(type_(getError('int')))
+	if _validation.enabled and not isinstance(b, types): raise NumericalError(type_(getError('int')))
 	if a < 2: raise NumericalError(value_("a must be greater than 2"))
 	if a%2 == 0: a += 1
 	primes = sorted(primeRange(int(b**0.5) + 1) + range(a, b + 1, 2))
@@ -103,7 +108,7 @@ def generate_primes(n):
 	"""Returns a dictionary of numbers on whether or not the numbers are prime:
 	>>> generate_primes(10)
 	{2: True, 3: True, 4: False, 5: True, 6: False, 7: True, 8: False, 9: False, 10: False}"""
-	if not isinstance(n, types): raise NumericalError(type_(getError('int')))
+	if _validation.enabled and not isinstance(n, types): raise NumericalError(type_(getError('int')))
 	if n < 2: raise NumericalError(value_("n must greater than 2"))
 	primes_dict = collections.OrderedDict({i : True for i in xrange(3, n + 1, 2)})
 	for i in primes_dict:
@@ -115,28 +120,53 @@ def generate_primes(n):
 	primes_dict[2] = True
 	return primes_dict
 	
+def sieve(n):
+	"""Returns a list of the primes up to 'n', with a Sieve of Eratosthenes over the odd numbers in a bytearray
+	>>> sieve(30)
+	[2, 3, 5, 7, 11, 13, 17, 19, 23, 29]"""
+	if _validation.enabled and not isinstance(n, types): raise NumericalError(type_(getError('int')))
+	n = int(n)
+	if n < 2: return []
+	size = (n + 1) // 2 # flags[i] is whether 2*i + 1 is prime
+	flags = bytearray([1]) * size
+	flags[0] = 0
+	for i in range(1, (_isqrt(n) + 1) // 2):
+		if flags[i]:
+			start = 2 * i * (i + 1) # the index of (2*i + 1)**2
+			flags[start::2 * i + 1] = bytearray(len(range(start, size, 2 * i + 1)))
+	return [2] + list(itertools.compress(range(1, n + 1, 2), flags))
+	
+def _sieve_segment(low, high, primes):
+	"""Returns the primes in [low, high) (with 2 <= low) for a segmented sieve, crossing out the multiples of 'primes' (all the primes up to the square root of 'high')"""
+	flags = bytearray([1]) * (high - low)
+	for p in primes:
+		if p * p >= high: break
+		start = max(p * p, (low + p - 1) // p * p)
+		flags[start - low::p] = bytearray(len(range(start, high, p)))
+	return list(itertools.compress(range(low, high), flags))
+	
 def prime(n):
 	"""Returns the 'n'th prime number
 	>>> prime(25)
 	97"""
-	return max(n_primes(n))
+	return n_primes(n)[-1]
 	
 def n_primes(n):
 	'''Returns 'n' amount of primes'''
-	if not isinstance(n, types): raise NumericalError(type_(getError('int')))
-	if n < 1: raise NumericalError(value_('n must be greater than 1'))
+	if _validation.enabled:
+		if not isinstance(n, types): raise NumericalError(type_(getError('int')))
+		if n < 1: raise NumericalError(value_('n must be greater than 1'))
 	primes, num = [2], 3
-	while len(primes) <= n:
-		if isPrime(num): primes.append(num)
+	while len(primes) < n:
+		if _isPrime(num): primes.append(num)
 		num += 2
-		if len(primes) == n: break
 	return primes
 	
 def fib(n):
 	"""Returns the 'n'th number in the Fibonacci sequence
 	>>> fib(25)
 	46368"""
-	if not isinstance(n, types): raise NumericalError(type_(getError('int')))
+	if _validation.enabled and not isinstance(n, types): raise NumericalError(type_(getError('int')))
 	nums = [0, 1, 1]
 	if n > 2:
 		for index in xrange(3, n): 
@@ -147,7 +177,7 @@ def prevFibs(n):
 	"""Returns the previous Fibonacci numbers up to 'n'
 	>>> prevFibs(1000)
 	[0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610, 987]"""
-	if not isinstance(n, types): raise NumericalError(type_(getError('int')))
+	if _validation.enabled and not isinstance(n, types): raise NumericalError(type_(getError('int')))
 	a, b, nums = 0, 1, [0, 1]
 	while b <= n:
 		a, b = b, a+b
@@ -159,39 +189,92 @@ def isCollatz(n):
 	"""Checks whether or not a number's Collatz sequence ends in 1
 	>>> isCollatz(25)
 	True"""
-	if not isinstance(n, types): raise NumericalError(type_(getError('int')))
+	if _validation.enabled and not isinstance(n, types): raise NumericalError(type_(getError('int')))
 	return collatz(n)[-1] == 1
 	
 def collatz(n):
 	"""Returns the Collatz sequence; breaks if there are more than 5000 elements
 	>>> collatz(25)
 	[25, 76, 38.0, 19.0, 58.0, 29.0, 88.0, 44.0, 22.0, 11.0, 34.0, 17.0, 52.0, 26.0, 13.0, 40.0, 20.0, 10.0, 5.0, 16.0, 8.0, 4.0, 2.0, 1.0]"""
-	if not isinstance(n, types): raise NumericalError(type_(getError('int')))
-	iterCount, nums = 0, [n]
-	while n != 1 and iterCount <= 5000:
+	if _validation.enabled and not isinstance(n, types): raise NumericalError(type_(getError('int')))
+	return [n] + _collatz(n, 5001)
+
+def _collatz(n, steps):
+	"""Unchecked kernel of collatz: returns at most 'steps' terms of the Collatz sequence after 'n', stopping at 1
+	Running it again from the last term continues the same sequence, which is how nums.aio splits it"""
+	nums = []
+	while n != 1 and len(nums) < steps:
 		if n%2 == 0:
 			n /= 2
-			nums.append(n)
 		else:
 			n = (3 * n) + 1
-			nums.append(n)
-		iterCount += 1
+		nums.append(n)
 	return nums
 	
-def decRange(start = 0, stop = 11, step = 1):
-	"""Generates numbers from start [,stop, step]
-	>>> decRange(start = 0, stop = 10, step = 1)
+def _scaled(n):
+	"""Returns 'n' as an exact (integer, exponent) pair, so that n == integer * 10**exponent
+	Floats are read by their shortest repr, so 0.1 is exactly one tenth"""
+	import decimal
+	if isinstance(n, decimal.Decimal): value = n
+	elif isinstance(n, float): value = decimal.Decimal(repr(n))
+	elif isinstance(n, types): value = decimal.Decimal(int(n))
+	else: raise NumericalError(type_(getError('num')))
+	if not value.is_finite(): raise NumericalError(value_("must be finite"))
+	sign, digits, exponent = value.as_tuple()
+	integer = int(''.join(map(str, digits)) or 0)
+	return (-integer if sign else integer), exponent
+
+def decRange(start = 0, stop = 11, step = 1, exact = False, as_array = False):
+	"""Generates numbers from start to stop (inclusive), by step
+	Each element is computed from its index as start + i*step in exact arithmetic, so errors do not accumulate
+	and stop is never overshot. With exact = True, the elements are Decimals; with as_array = True,
+	the range is returned as a preallocated NumPy array (or array('d') without NumPy)
+	>>> list(decRange(start = 0, stop = 10, step = 1))
 	[0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
-	>>> decRange(stop = 1, step = 0.1)
-	[0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]"""
-	for elem in (start, stop, step):
-		if not isinstance(elem, types): raise NumericalError(type_(getError('float')))
-	results, roundN = [], len(str(step)) - 2
-	if roundN < 0: roundN = 0
-	start -= step
-	while start <= stop:
-		start += step
-		yield round(start, roundN)
+	>>> list(decRange(stop = 1, step = 0.1))
+	[0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+	>>> list(decRange(stop = 0.3, step = 0.1, exact = True))
+	[Decimal('0.0'), Decimal('0.1'), Decimal('0.2'), Decimal('0.3')]
+	>>> len(decRange(stop = 1, step = 0.001, as_array = True))
+	1001"""
+	values = [_scaled(elem) for elem in (start, stop, step)]
+	exponent = min(elem[1] for elem in values)
+	first, last, increment = [integer * 10 ** (elem_exponent - exponent) for integer, elem_exponent in values]
+	if increment == 0: raise NumericalError(value_(getError('nonzero')))
+	count = max(0, (last - first) // increment + 1)
+	if exact and as_array: raise NumericalError(value_("exact and as_array cannot both be used"))
+	if as_array: return _decArray(first, increment, count, exponent)
+	return _decGenerator(first, increment, count, exponent, exact)
+
+def _decGenerator(first, increment, count, exponent, exact):
+	"""Yields (first + i*increment) * 10**exponent for i in range(count)"""
+	if exact:
+		import decimal
+		for i in range(count):
+			yield decimal.Decimal('{0}E{1}'.format(first + i * increment, exponent)) # parsing does not round to the context precision, unlike scaleb
+	elif exponent < 0:
+		scale = 10 ** -exponent
+		for i in range(count):
+			yield (first + i * increment) / scale # int / int is correctly rounded
+	else:
+		scale = 10 ** exponent
+		for i in range(count):
+			yield float((first + i * increment) * scale)
+
+def _decArray(first, increment, count, exponent):
+	"""Returns the range of _decGenerator as an array of floats"""
+	numpy = _numpy()
+	if numpy is not None:
+		if max(abs(first), abs(first + (count - 1) * increment)) < 2 ** 53 and abs(exponent) <= 22:
+			# every numerator and 10**exponent is exact in a double, so one division rounds correctly
+			grid = numpy.arange(count, dtype = numpy.float64)
+			grid *= increment
+			grid += first
+			if exponent < 0: grid /= 10.0 ** -exponent
+			else: grid *= 10.0 ** exponent
+			return grid
+		return numpy.fromiter(_decGenerator(first, increment, count, exponent, False), numpy.float64, count)
+	return array('d', _decGenerator(first, increment, count, exponent, False))
 		
 ### Example to show the module's capabilities
 
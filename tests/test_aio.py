@@ -0,0 +1,50 @@
+import concurrent.futures
+import asyncio
+import time
+
+import pytest
+
+from nums import aio
+from nums.number_theory import integral, pFactors
+from nums.sequences import collatz
+
+
+def test_pfactors_matches_sync_for_every_chunk_size():
+	for n in (1, 2, 144, 600851475143, 2 * 3 * 5 * 7 * 11 * 13 * 9973, 999983 * 999979):
+		for chunk in ((1, 7, 10**6) if n < 10**9 else (7, 10**3, 10**6)):
+			assert asyncio.run(aio.pFactors(n, chunk = chunk)) == pFactors(n)
+
+
+def test_integral_matches_sync():
+	for method in ('left', 'middle', 'right', 'trapezoid', 'simpsons'):
+		expected = integral('x**2', n = 1001, stop = 3, method = method)
+		assert asyncio.run(aio.integral('x**2', n = 1001, stop = 3, method = method, chunks = 1)) == expected
+		assert abs(asyncio.run(aio.integral('x**2', n = 1001, stop = 3, method = method)) - expected) < 1e-12
+		assert asyncio.run(aio.integral('x', n = 9, stop = 9, method = method, return_shapes = True, chunks = 4)) == \
+			integral('x', n = 9, stop = 9, method = method, return_shapes = True)
+
+
+def test_collatz_matches_sync():
+	for n in (1, 6, 27, 97, 0):
+		assert asyncio.run(aio.collatz(n, chunk = 7)) == collatz(n)
+
+
+def test_progress_is_reported_between_chunks():
+	seen = []
+	asyncio.run(aio.integral('x', n = 100, chunks = 4, progress = lambda done, total: seen.append((done, total))))
+	assert seen == [(25, 101), (50, 101), (75, 101), (101, 101)]
+	seen = []
+	asyncio.run(aio.collatz(27, chunk = 50, progress = lambda done, total: seen.append(done)))
+	assert seen == [51, 101, 112]
+
+
+def test_timeout_stops_the_remaining_chunks():
+	calls = []
+	def slow(x):
+		calls.append(x)
+		time.sleep(0.01)
+		return x
+	with pytest.raises(asyncio.TimeoutError):
+		asyncio.run(aio.integral(slow, n = 1000, chunks = 100, executor = concurrent.futures.ThreadPoolExecutor(1), timeout = 0.1))
+	time.sleep(0.2)
+	assert len(calls) < 100
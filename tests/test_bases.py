@@ -0,0 +1,49 @@
+import math
+
+import pytest
+
+from nums import bases
+from nums.bases import Function
+from nums.errors import _numpy
+
+backends = ['python'] + (['numpy'] if _numpy() is not None else [])
+
+
+@pytest.fixture(params = backends)
+def backend(request, monkeypatch):
+	if request.param == 'python': monkeypatch.setattr(bases, '_numpy', lambda: None)
+	return request.param
+
+
+def values(result):
+	return ['nan' if math.isnan(value) else value for value in result]
+
+
+def test_evaluate_many_maps_complex_and_infinite_results_to_nan(backend):
+	assert values(Function('x**0.5').evaluate_many({'x': [-1, 4]})) == ['nan', 2.0]
+	assert values(Function('log(x)').evaluate_many({'x': [0, 1]})) == ['nan', 0.0]
+	assert values(Function('1/x').evaluate_many({'x': [0, 2]})) == ['nan', 0.5]
+
+
+def test_evaluate_many_evaluates_conditional_expressions_by_row(backend):
+	result = Function('x if x > 0 else -2*x').evaluate_many({'x': [-1, 0, 3]})
+	assert list(result) == [2.0, 0.0, 3.0]
+	assert values(Function('log(x) if x > 0 else x**0.5').evaluate_many({'x': [-4, 1]})) == ['nan', 0.0]
+
+
+def test_derivative():
+	assert Function('x**3 + sin(2*x)').derivative('x').expression == '3*x**2 + cos(2*x)*2'
+	assert abs(Function('x**2*y + exp(x)').derivative('x').evaluate(x = 1, y = 3) - (6 + math.e)) < 1e-12
+
+
+def test_roots_skip_poles():
+	assert Function('1/(x-0.55)').roots(interval = (0, 1)) == []
+	roots = Function('tan(x)').roots(interval = (1, 10))
+	assert [round(root / math.pi, 9) for root in roots] == [1, 2, 3]
+
+
+def test_roots_keep_steep_and_closed_form_roots():
+	assert [round(root, 12) for root in Function('x**2 - 2').roots('x', (0, 2))] == [round(2 ** 0.5, 12)]
+	assert abs(Function('1000*(x-0.3)+sin(x)').roots(interval = (0, 1))[0] - 0.29970476185863415) < 1e-12
+	assert [round(root, 9) for root in Function('1e8*(x**3-x)').roots(interval = (-2, 2))] == [-1, 0, 1]
+	assert len(Function('cos(x)').roots('x', (0, 10))) == 3
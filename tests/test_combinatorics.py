@@ -0,0 +1,40 @@
+import math
+
+import pytest
+
+from nums.combinatorics import binomial, binomial_mod, factorial, multinomial
+from nums.errors import NumericalError
+
+
+def test_factorial_and_binomial_match_brute_force():
+	product = 1
+	for n in range(300):
+		assert factorial(n) == product
+		product *= n + 1
+	for n in range(60):
+		row = [1]
+		for k in range(n):
+			row.append(row[-1] * (n - k) // (k + 1))
+		assert [binomial(n, k) for k in range(n + 3)] == row + [0, 0]
+
+
+def test_multinomial():
+	assert multinomial(3, 4, 5) == math.factorial(12) // (math.factorial(3) * math.factorial(4) * math.factorial(5))
+	assert multinomial([2, 2]) == 6 and multinomial(7) == 1 and multinomial(0, 0) == 1
+
+
+def test_binomial_mod_matches_exact_values():
+	for m in (1, 2, 7, 8, 12, 27, 1000, 1000000, 9973 * 4):
+		for n in range(0, 90, 7):
+			for k in range(0, n + 2, 3):
+				assert binomial_mod(n, k, m) == binomial(n, k) % m
+	for m in (10**6, 2**20, 3**12 * 7, 999983):
+		assert binomial_mod(5000, 1234, m) == binomial(5000, 1234) % m
+
+
+def test_arguments_are_validated():
+	for bad in (-1, 2.5, float('inf'), '3'):
+		with pytest.raises(NumericalError):
+			factorial(bad)
+	with pytest.raises(NumericalError):
+		binomial(5, -1)
@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+
+from nums.errors import NumericalError, setTrusted, trusted
+from nums.sequences import isPrime
+
+
+def test_trusted_only_applies_to_the_current_thread():
+	entered, checked = threading.Event(), threading.Event()
+
+	def trusting():
+		with trusted():
+			entered.set()
+			checked.wait(5)
+
+	thread = threading.Thread(target = trusting)
+	thread.start()
+	entered.wait(5)
+	try:
+		with pytest.raises(NumericalError):
+			isPrime('7')
+	finally:
+		checked.set()
+		thread.join(5)
+
+
+def test_trusted_restores_the_previous_setting():
+	assert setTrusted(False) is False
+	with trusted():
+		with trusted():
+			pass
+		assert setTrusted(True) is True
+	assert setTrusted(False) is False
+
+
+def test_trusted_only_applies_to_the_current_task():
+	asyncio = pytest.importorskip('asyncio')
+
+	async def trusting(inside, release):
+		with trusted():
+			inside.set()
+			await release.wait()
+
+	async def main():
+		inside, release = asyncio.Event(), asyncio.Event()
+		task = asyncio.ensure_future(trusting(inside, release))
+		await inside.wait()
+		try:
+			with pytest.raises(NumericalError):
+				isPrime('7')
+		finally:
+			release.set()
+			await task
+
+	asyncio.run(main())
+
+
+def test_is_prime_rejects_non_finite_floats():
+	for value in (float('inf'), float('-inf'), float('nan')):
+		with pytest.raises(NumericalError):
+			isPrime(value)
+	assert isPrime(7.0) and not isPrime(7.5)
@@ -0,0 +1,41 @@
+import warnings
+
+import pytest
+
+from nums import figurate
+from nums.errors import NumericalError, _numpy
+from nums.figurate import is_polygonal, is_triangular, polygonal, polygonal_count, polygonal_index, polygonal_range
+
+backends = ['python'] + (['numpy'] if _numpy() is not None else [])
+
+
+@pytest.fixture(params = backends)
+def backend(request, monkeypatch):
+	if request.param == 'python': monkeypatch.setattr(figurate, '_numpy', lambda: None)
+	return request.param
+
+
+def test_membership_matches_brute_force(backend):
+	for k in (3, 4, 5, 6, 11):
+		members = set(polygonal(k, n) for n in range(60))
+		values = list(range(-5, 1000))
+		assert list(is_polygonal(k, values)) == [value in members for value in values]
+		assert [is_polygonal(k, value) for value in values] == [value in members for value in values]
+
+
+def test_invalid_entries_are_not_members(backend):
+	with warnings.catch_warnings():
+		warnings.simplefilter('error')
+		assert list(is_triangular([-5, 3, 2.5, 6, float('inf'), float('nan'), 6.0])) == [False, True, False, True, False, False, True]
+	for value in (float('inf'), float('-inf'), float('nan'), -1, 2.5):
+		assert is_triangular(value) is False
+
+
+def test_counting_and_ranges():
+	assert polygonal_count(4, 1, 10**12) == 10**6
+	assert list(polygonal_range(6, 1, 100)) == [1, 6, 15, 28, 45, 66, 91]
+	assert polygonal_index(3, 5050) == 100 and polygonal_index(3, 5049) == 99
+	assert polygonal(3, 10**20) == (10**40 + 10**20) // 2
+	for value in (2.5, float('inf'), float('nan'), '3'):
+		with pytest.raises(NumericalError):
+			polygonal_count(3, 1, value)
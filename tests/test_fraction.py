@@ -0,0 +1,67 @@
+import sys
+from decimal import Decimal
+
+import pytest
+
+from nums.errors import NumericalError
+from nums.Fraction import Fraction, FractionArray, parse_fractions, prod_fractions
+
+
+def test_mixed_decimal_arithmetic_is_in_lowest_terms():
+	product = Fraction(1, 2) * Decimal('0.50')
+	assert product == Fraction(1, 4)
+	assert hash(product) == hash(Fraction(1, 4))
+	total = Fraction(1, 2) + Decimal('0.50')
+	assert total == Fraction(1)
+	assert hash(total) == hash(Fraction(1))
+	difference = Fraction(3, 4) - Decimal('0.250')
+	assert difference == Fraction(1, 2)
+	assert hash(difference) == hash(Fraction(1, 2))
+	quotient = Fraction(1, 4) / Decimal('0.50')
+	assert quotient == Fraction(1, 2)
+	assert hash(quotient) == hash(Fraction(1, 2))
+
+
+
+def test_prod_fractions_with_unreduced_decimal_leaves():
+	product = prod_fractions([Decimal('0.5'), 2])
+	assert product == Fraction(1)
+	assert hash(product) == hash(Fraction(1))
+	product = prod_fractions([Decimal('0.50'), Decimal('0.40'), Fraction(5, 3)])
+	assert product == Fraction(1, 3)
+	assert hash(product) == hash(Fraction(1, 3))
+
+
+def test_operators_defer_to_the_other_operand():
+	array = FractionArray([1, 2], [3, 5])
+	assert repr(Fraction(1, 2) + array).endswith('[5/6, 9/10]')
+	assert repr(Fraction(1, 2) * array).endswith('[1/6, 1/5]')
+	assert repr(Fraction(1, 2) - array).endswith('[1/6, 1/10]')
+	assert repr(Fraction(1, 2) / array).endswith('[3/2, 5/4]')
+
+
+def test_operators_return_not_implemented_for_unknown_types():
+	assert Fraction(1, 2).__add__(object()) is NotImplemented
+	assert Fraction(1, 2).__rtruediv__([]) is NotImplemented
+	with pytest.raises(TypeError):
+		Fraction(1, 2) + object()
+	with pytest.raises(NumericalError):
+		Fraction(1, 2).add(object())
+
+
+def test_parse_fractions_rejects_huge_exponents():
+	with pytest.raises(NumericalError) as error:
+		list(parse_fractions('1/2\n3 1e400000000'))
+	assert 'line 2, column 3' in str(error.value)
+	assert list(parse_fractions('1e3 25e-2', pairs = True)) == [(1000, 1), (1, 4)]
+
+
+def test_hash_matches_equal_numbers_of_other_types():
+	import fractions
+	for num, dom in ((1, 5), (-1, 5), (3, 4), (7, 1), (-7, 1), (10**30 + 1, 3), (1, sys.hash_info.modulus), (-1, 2 * sys.hash_info.modulus), (0, 1)):
+		value = Fraction(num, dom)
+		assert hash(value) == hash(fractions.Fraction(num, dom))
+	assert Fraction(1, 5) == Decimal('0.2') and hash(Fraction(1, 5)) == hash(Decimal('0.2'))
+	assert hash(Fraction(3, 4)) == hash(0.75) and hash(Fraction(-6, 2)) == hash(-3)
+	assert {Decimal('0.2'): 'fifth'}[Fraction(1, 5)] == 'fifth'
+	assert Fraction(1, 5) in {Decimal('0.2')}
@@ -0,0 +1,54 @@
+import importlib
+
+import pytest
+
+from nums.errors import NumericalError, _numpy
+from nums.Fraction import Fraction, FractionArray
+
+fraction_module = importlib.import_module('nums.Fraction') # 'nums.Fraction' the attribute is the class
+
+
+@pytest.fixture(params = ['python'] + (['numpy'] if _numpy() is not None else []))
+def backend(request, monkeypatch):
+	if request.param == 'python': monkeypatch.setattr(fraction_module, '_numpy', lambda: None)
+	return request.param
+
+
+def pairs(values):
+	return [(value._num, value._dom) for value in values]
+
+
+def python_ints(storage):
+	return isinstance(storage, list) or getattr(storage, 'dtype', None) == object
+
+
+def test_overflowing_int64_is_promoted_to_python_ints(backend):
+	big = FractionArray([2**62, -2**62, 1], [1, 1, 3])
+	assert not python_ints(big.numerators) and python_ints((big + big).numerators) and python_ints(FractionArray([2**63], [1]).numerators)
+	assert pairs(big + big) == [(2**63, 1), (-2**63, 1), (2, 3)]
+	assert pairs(big * big) == [(2**124, 1), (2**124, 1), (1, 9)]
+	assert pairs(big / FractionArray([1, 1, 2**62], [2**62 + 1, 3, 1])) == [(2**62 * (2**62 + 1), 1), (-3 * 2**62, 1), (1, 3 * 2**62)]
+	huge = FractionArray([10**30, 1], [3, 10**25])
+	assert pairs(huge - Fraction(1, 3)) == [((10**30 - 1) // 3, 1), ((3 - 10**25), 3 * 10**25)]
+	assert (big + big).sum() == Fraction(2, 3)
+	assert list(huge > 1) == [True, False]
+
+
+def test_comparisons(backend):
+	values = FractionArray([1, 2, 3], [3, 3, 3])
+	assert list(values < Fraction(2, 3)) == [True, False, False]
+	assert list(values == Fraction(2, 3)) == [False, True, False]
+	assert list(values >= 0.5) == [False, True, True]
+	assert list(values != FractionArray([1, 1, 1], [3, 2, 1])) == [False, True, False]
+	assert list(Fraction(2, 3) <= values) == [False, True, True]
+	with pytest.raises(NumericalError):
+		values < FractionArray([1], [2])
+
+
+def test_empty_arrays(backend):
+	empty = FractionArray([])
+	assert len(empty) == 0 and list(empty) == []
+	assert empty.sum() == 0 and empty.prod() == 1
+	assert len(empty + Fraction(1, 2)) == 0 and len(empty * 3) == 0 and len(empty + empty) == 0
+	assert list(empty < 1) == [] and list(empty.decimal()) == []
+	assert len(FractionArray([], [])) == 0
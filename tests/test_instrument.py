@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+from nums import instrument
+from nums import sequences
+
+
+def test_enable_records_calls_until_disable():
+	instrument.reset()
+	instrument.enable()
+	try:
+		assert instrument.enabled()
+		sequences.isPrime(97)
+		sequences.isPrime(98)
+	finally:
+		instrument.disable()
+	assert not instrument.enabled()
+	sequences.isPrime(97)
+	stats = instrument.snapshot()['nums.sequences.isPrime']
+	assert stats['calls'] == 2 and stats['callers'] == {'<direct>': 2}
+	assert stats['min'] <= stats['p50'] <= stats['max']
+	instrument.reset()
+	assert instrument.snapshot() == {}
+
+
+def test_enabling_twice_wraps_once():
+	instrument.reset()
+	instrument.enable()
+	try:
+		instrument.enable()
+		with instrument.report() as report:
+			sequences.isPrime(97)
+	finally:
+		instrument.disable()
+	assert report.snapshot['nums.sequences.isPrime']['calls'] == 1
+	assert report.snapshot['nums.sequences._isPrime']['callers'] == {'nums.sequences.isPrime': 1}
+	assert not hasattr(sequences.isPrime, '_instrumented')
+
+
+def test_report_records_its_block_separately():
+	instrument.reset()
+	with instrument.report() as report:
+		sequences.n_primes(10)
+	assert not instrument.enabled()
+	assert report.snapshot['nums.sequences.n_primes']['calls'] == 1
+	assert 'nums.sequences.n_primes' in report.text()
+	assert instrument.snapshot()['nums.sequences.n_primes']['calls'] == 1
+	instrument.reset()
+
+
+def test_environment_variable_and_enable_do_not_double_count():
+	script = 'import nums.instrument as i, nums.sequences as s\ni.enable()\nwith i.report() as r: s.isPrime(97)\nprint(r.snapshot["nums.sequences.isPrime"]["calls"])'
+	root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+	output = subprocess.check_output([sys.executable, '-c', script], cwd = root, env = dict(os.environ, NUMS_INSTRUMENT = '1'))
+	assert output.split() == [b'1']
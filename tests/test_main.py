@@ -0,0 +1,26 @@
+import os
+import subprocess
+import sys
+
+from nums.__main__ import main
+from nums.sequences import sieve
+
+
+def test_primes_across_segments(capsys):
+	b = (1 << 20) + 1000
+	assert main(['primes', '2', str(b), '-j', '1']) == 0
+	assert capsys.readouterr().out.split() == [str(p) for p in sieve(b)]
+
+
+def test_factor_and_isprime(capsys):
+	assert main(['factor', '600851475143', '144', '-j', '1']) == 0
+	assert capsys.readouterr().out == '600851475143: 71 839 1471 6857\n144: 2 2 2 2 3 3\n'
+	assert main(['isprime', '97', 'x', '-j', '1']) == 1
+	output = capsys.readouterr()
+	assert output.out == '97: True\n' and output.err.startswith('x: error:')
+
+
+def test_primes_on_a_process_pool():
+	root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+	output = subprocess.check_output([sys.executable, '-m', 'nums', 'primes', '10', '50', '-j', '2'], cwd = root)
+	assert output.split() == [b'11', b'13', b'17', b'19', b'23', b'29', b'31', b'37', b'41', b'43', b'47']
@@ -0,0 +1,75 @@
+from decimal import Decimal, localcontext
+import subprocess
+import sys
+import math
+import os
+
+import pytest
+
+from nums import number_theory
+from nums.errors import _numpy
+from nums.Fraction import Fraction
+from nums.number_theory import gaussSum, decPi, decE, decSin, sinR, sinD, cosD, tanD, quadForm, quadForm_many
+
+
+def test_gauss_sum_keeps_exact_non_integer_types():
+	assert gaussSum([Decimal('0.5'), Decimal('1.0')]) == Decimal('1.5')
+	assert gaussSum([Fraction(1, 2), Fraction(3, 2)]) == Fraction(2)
+	assert gaussSum([0.5, 1.5]) == 2.0
+
+
+def test_gauss_sum_of_integers_is_an_int():
+	assert gaussSum([1, 2, 3]) == 6 and isinstance(gaussSum([1, 2, 3]), int)
+	assert gaussSum(range(1, 10**12 + 1)) == 500000000000500000000000
+
+
+def test_decimal_constants_ignore_the_precision_at_import():
+	script = 'import decimal; decimal.getcontext().prec = 6; import nums; nums.gcf(4, 6); print(nums.pi, nums.e, nums.sinR(nums.pi))'
+	output = subprocess.check_output([sys.executable, '-c', script], cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+	pi, e, sine = output.decode().split()
+	assert pi == '3.1415926535897932384626433832795028841971693993751'
+	assert e == '2.7182818284590452353602874713526624977572470937000'
+	assert sine == '0'
+
+
+def test_decimal_pi_e_and_sin():
+	with localcontext() as context:
+		context.prec = 60
+		assert str(decPi()) == '3.14159265358979323846264338327950288419716939937510582097494'
+		assert str(decE()) == '2.71828182845904523536028747135266249775724709369995957496697'
+		assert str(decPi(10)) == '3.141592654' and str(decE(10)) == '2.718281828'
+		context.prec = 40
+		assert decSin(1) == Decimal('0.8414709848078965066525023216302989996226')
+		assert abs(decSin(decPi())) < Decimal('1e-39')
+		assert decSin(-1) == -decSin(1)
+		assert abs(decSin(1000) - Decimal('0.8268795405320025602558874291092181412127')) < Decimal('1e-39')
+
+
+def test_tiny_negative_angles_are_not_snapped_to_a_full_turn():
+	assert sinR(-1e-20) == -1e-20 and sinR(1e-20) == 1e-20
+	assert sinD(-1e-14) == -sinD(1e-14) != 0
+	assert sinD(-30) == -0.5 and cosD(-360) == 1 and tanD(-45) == -1
+	assert list(sinR([-1e-20, 1e-20])) == [-1e-20, 1e-20]
+	assert list(sinD([-30, 720])) == [-0.5, 0]
+
+
+@pytest.fixture(params = ['python'] + (['numpy'] if _numpy() is not None else []))
+def backend(request, monkeypatch):
+	if request.param == 'python': monkeypatch.setattr(number_theory, '_numpy', lambda: None)
+	return request.param
+
+
+def test_quad_form_many_without_a_quadratic_term(backend):
+	x1, x2 = quadForm_many([0, 0, 0], [0, 0, 2], [0, 3, -4])
+	assert [math.isnan(x) for x in x1] == [True, True, False] and x1[2] == 2
+	assert all(math.isnan(x) for x in x2)
+
+
+def test_quad_form_many_reads_iterables_once(backend):
+	x1, x2 = quadForm_many((a for a in [1, 1]), iter([-3, -2]), (c for c in [2, 1]))
+	assert list(x1) == [2.0, 1.0] and list(x2) == [1.0, 1.0]
+
+
+def test_quad_form_without_real_roots_is_nan():
+	assert all(math.isnan(x) for x in quadForm(1, 0, 1))
+	assert quadForm(1, 0, 0) == (0.0, 0.0)
@@ -0,0 +1,16 @@
+from decimal import Decimal, localcontext
+
+from nums.sequences import decRange
+
+
+def test_exact_dec_range_does_not_round_large_endpoints():
+	assert list(decRange(10**30, 10**30 + 2, 1, exact = True)) == [Decimal(10**30), Decimal(10**30 + 1), Decimal(10**30 + 2)]
+	with localcontext() as context:
+		context.prec = 5
+		assert list(decRange(Decimal('1.000001'), Decimal('1.000003'), Decimal('0.000001'), exact = True)) == \
+			[Decimal('1.000001'), Decimal('1.000002'), Decimal('1.000003')]
+
+
+def test_exact_dec_range_keeps_the_step_exponent():
+	assert list(decRange(stop = 0.3, step = 0.1, exact = True)) == [Decimal('0.0'), Decimal('0.1'), Decimal('0.2'), Decimal('0.3')]
+	assert [str(value) for value in decRange(stop = 0.3, step = 0.1, exact = True)] == ['0.0', '0.1', '0.2', '0.3']